@@ -1,34 +1,139 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import numpy as np
+import math
 import sqlite3
-import time
 import json
+import time
 import os
 import socket
+import threading
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import plotly.express as px
-import plotly.graph_objects as go
-from IPython.display import display, HTML
-import seaborn as sns
-import matplotlib.pyplot as plt
-import ipywidgets as widgets
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.table import Table
 import argparse
-from plotly.subplots import make_subplots
 
 OLLAMA_API_URL = "http://host.docker.internal:11434"
+
+# Fixed parts of every generate request; run_test adds the swept options
+GENERATE_PAYLOAD = {
+    "model": "deepseek-r1:7b",
+    "prompt": "Write a hello world in Python",
+    "stream": False,
+}
+GENERATE_OPTIONS = {
+    "num_predict": 100,
+    "temperature": 0.1,
+    "top_p": 0.9,
+    "top_k": 10,
+}
+
+# Columns of performance_runs, in insert order
+RUN_COLUMNS = (
+    'timestamp', 'gpu_layers', 'batch_size', 'compute_threads',
+    'total_duration', 'load_duration', 'prompt_eval_duration',
+    'eval_duration', 'tokens_per_second', 'avg_token_time'
+)
+INSERT_SQL = (
+    f"INSERT INTO performance_runs ({', '.join(RUN_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(RUN_COLUMNS))})"
+)
+# Swept configuration columns of performance_runs
+CONFIG_COLUMNS = ('gpu_layers', 'batch_size', 'compute_threads')
+# Metrics where a smaller value is a better result
+LOWER_IS_BETTER = frozenset({
+    'avg_token_time', 'total_duration', 'eval_duration',
+    'load_duration', 'prompt_eval_duration'
+})
+# Row markup for the dashboard's metrics and top-runs tables
+METRIC_ROW_TEMPLATE = """
+    <tr>
+        <td>{0}</td>
+        <td>{1:.3f}</td>
+        <td>{2:.3f}</td>
+        <td style="background: {3}">
+            {4}
+        </td>
+    </tr>
+"""
+TOP_RUN_ROW_TEMPLATE = """
+    <tr>
+        <td>{0}</td>
+        <td>{1}</td>
+        <td>{2}</td>
+        <td>{3}</td>
+        <td>{4:.3f}</td>
+        <td>{5:.3f}</td>
+        <td>{6:.3f}</td>
+    </tr>
+"""
+# Most points drawn in the performance history graph
+HISTORY_MAX_POINTS = 800
 console = Console()
 
+
+def _lttb_indices(x, y, n_out):
+    """Pick the indices of n_out points with Largest-Triangle-Three-Buckets.
+
+    x and y are float numpy arrays of equal length. The first and last
+    points are always kept; each bucket in between keeps the point forming
+    the largest triangle with the last kept point and the next bucket's
+    mean, so peaks and dips survive the downsampling.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return list(range(n))
+
+    every = (n - 2) / (n_out - 2)
+    indices = [0]
+    a = 0
+    for i in range(n_out - 2):
+        # Mean of the next bucket (the final point for the last bucket)
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices.append(a)
+    indices.append(n - 1)
+    return indices
+
 class OllamaProfiler:
     def __init__(self):
         self.db_path = Path.home() / ".config/ollama/performance.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the profiler's lifetime instead of one per call
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.setup_database()
+        # Live feed of finished runs, one JSON object per line, so a watcher
+        # (tail -f, a log shipper) can chart a sweep while it is running.
+        # Opened on the first saved run so read-only use leaves no file behind.
+        self.live_path = self.db_path.with_name("performance_live.jsonl")
+        self._live = None
+
+        # Keep-alive session so connection setup doesn't skew the timings
+        self._http = requests.Session()
+        # One pool per Ollama server (host:port) in a sweep
+        self._http.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=4))
+        # Servers that passed the connection check
+        self._ready_urls = set()
+        # SQLite allows one writer; sweep workers take turns
+        self._db_lock = threading.Lock()
+        # Rows waiting to be written; flushed in one transaction
+        self._row_buffer: list[tuple] = []
+        self._flush_threshold = 64
         
         # Verify host.docker.internal resolution
         try:
@@ -40,8 +145,7 @@ class OllamaProfiler:
         
     def setup_database(self):
         """Initialize SQLite database for storing performance metrics"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self._conn.cursor()
         c.execute('''CREATE TABLE IF NOT EXISTS performance_runs
                     (timestamp TEXT,
                      gpu_layers INTEGER,
@@ -53,14 +157,106 @@ class OllamaProfiler:
                      eval_duration REAL,
                      tokens_per_second REAL,
                      avg_token_time REAL)''')
-        conn.commit()
-        conn.close()
+        # Indices for the dashboard's sort orders and per-config lookups
+        c.execute("CREATE INDEX IF NOT EXISTS idx_runs_tps "
+                  "ON performance_runs(tokens_per_second)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_runs_timestamp "
+                  "ON performance_runs(timestamp)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_runs_config "
+                  "ON performance_runs(gpu_layers, batch_size, compute_threads)")
+        self._conn.commit()
 
-    def check_ollama_connection(self):
+        # Local scratch DB: trade strict durability for fast commits.
+        # journal_mode persists in the file; the rest apply to this connection.
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA temp_store=MEMORY")
+        c.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+        # Wait for another profiler process's write instead of failing
+        c.execute("PRAGMA busy_timeout=5000")
+
+    def close(self):
+        """Flush buffered runs and close the database connection and HTTP session"""
+        self.flush()
+        self._conn.close()
+        self._http.close()
+        if self._live is not None:
+            self._live.close()
+
+    def __del__(self):
+        """Flush buffered runs and release resources when the profiler is collected"""
+        conn = getattr(self, '_conn', None)
+        try:
+            if conn is not None:
+                try:
+                    self.flush()
+                finally:
+                    conn.close()
+        finally:
+            http = getattr(self, '_http', None)
+            if http is not None:
+                http.close()
+            live = getattr(self, '_live', None)
+            if live is not None:
+                live.close()
+
+    def get_connection(self):
+        """Get the shared database connection, with buffered runs written first"""
+        self.flush()
+        return self._conn
+
+    def save_runs(self, runs, flush=True):
+        """Buffer run metrics for insertion into the database.
+
+        The buffer is written once it reaches the flush threshold, or right
+        away when flush is True. Each run is also appended to the live feed
+        at live_path immediately.
+        """
+        rows = [tuple(run[col] for col in RUN_COLUMNS) for run in runs]
+        with self._db_lock:
+            if self._live is None:
+                self._live = open(self.live_path, "a", buffering=1)
+            for run in runs:
+                self._live.write(json.dumps(run) + "\n")
+            self._row_buffer.extend(rows)
+            if flush or len(self._row_buffer) >= self._flush_threshold:
+                self._flush_locked()
+
+    def flush(self):
+        """Write any buffered runs so they can be read back"""
+        with self._db_lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Write the row buffer in a single transaction (caller holds the lock)"""
+        if not self._row_buffer:
+            return
+        with self._conn:
+            self._conn.executemany(INSERT_SQL, self._row_buffer)
+        self._row_buffer.clear()
+
+    def _wait_ready(self, base_url=OLLAMA_API_URL, timeout=5.0):
+        """Poll the Ollama version endpoint with backoff until it answers.
+
+        Returns the last response, or raises the last connection error
+        once the timeout has passed.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            try:
+                return self._http.get(f"{base_url}/api/version", timeout=0.5)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+
+    def check_ollama_connection(self, base_url=OLLAMA_API_URL):
         """Check if Ollama is accessible"""
         try:
-            console.print(f"[yellow]Checking Ollama connection at {OLLAMA_API_URL}...[/]")
-            response = requests.get(f"{OLLAMA_API_URL}/api/version")
+            console.print(f"[yellow]Checking Ollama connection at {base_url}...[/]")
+            response = self._wait_ready(base_url)
             if response.status_code == 200:
                 version = response.json().get('version', 'unknown')
                 console.print(f"[green]Connected to Ollama version {version}[/]")
@@ -76,52 +272,52 @@ class OllamaProfiler:
             console.print(f"[red]Unexpected error: {str(e)}[/]")
             return False
 
-    def run_test(self, gpu_layers, batch_size, compute_threads):
-        """Run a single performance test"""
+    def run_test(self, gpu_layers, batch_size, compute_threads, base_url=OLLAMA_API_URL,
+                 flush=True):
+        """Run a single performance test against the Ollama server at base_url.
+
+        With flush=False the result is buffered and written in a later batch.
+        """
         console.print(f"\n[bold blue]Running test with settings:[/]")
         console.print(f"GPU Layers: {gpu_layers}")
         console.print(f"Batch Size: {batch_size}")
         console.print(f"Compute Threads: {compute_threads}")
 
-        # Check Ollama connection
-        if not self.check_ollama_connection():
-            console.print("[bold red]Error: Cannot connect to Ollama on host[/]")
-            return None
+        # Check Ollama connection once, not before every run
+        if base_url not in self._ready_urls:
+            if not self.check_ollama_connection(base_url):
+                console.print("[bold red]Error: Cannot connect to Ollama on host[/]")
+                return None
+            self._ready_urls.add(base_url)
 
         # Run test
         try:
-            response = requests.post(
-                f"{OLLAMA_API_URL}/api/generate",
+            response = self._http.post(
+                f"{base_url}/api/generate",
                 json={
-                    "model": "deepseek-r1:7b",
-                    "prompt": "Write a hello world in Python",
+                    **GENERATE_PAYLOAD,
                     "options": {
-                        "num_predict": 100,
-                        "temperature": 0.1,
-                        "top_p": 0.9,
-                        "top_k": 10,
-                        "num_gpu_layers": gpu_layers,
-                        "num_threads": compute_threads,
+                        **GENERATE_OPTIONS,
+                        # Ollama's per-request names for the swept knobs
+                        "num_gpu": gpu_layers,
+                        "num_thread": compute_threads,
                         "num_batch": batch_size
                     }
-                }
+                },
+                timeout=300
             )
             
-            # Handle streaming response
-            last_metrics = None
-            for line in response.text.strip().split('\n'):
-                try:
-                    data = json.loads(line)
-                    if 'total_duration' in data:  # Only store the final metrics
-                        last_metrics = data
-                except json.JSONDecodeError:
-                    continue
+            # Non-streaming response: a single JSON body with the final metrics
+            data = response.json()
+            last_metrics = data if 'total_duration' in data else None
             
             if not last_metrics:
                 console.print("[red]No metrics received from Ollama[/]")
                 return None
                 
-            # Calculate metrics
+            # Calculate metrics (Ollama reports durations in nanoseconds)
+            eval_count = last_metrics['eval_count']
+            eval_seconds = last_metrics['eval_duration'] / 1e9
             run_metrics = {
                 'timestamp': datetime.now().isoformat(),
                 'gpu_layers': gpu_layers,
@@ -130,9 +326,9 @@ class OllamaProfiler:
                 'total_duration': last_metrics['total_duration'] / 1e9,
                 'load_duration': last_metrics['load_duration'] / 1e9,
                 'prompt_eval_duration': last_metrics['prompt_eval_duration'] / 1e9,
-                'eval_duration': last_metrics['eval_duration'] / 1e9,
-                'tokens_per_second': last_metrics['eval_count'] / (last_metrics['eval_duration'] / 1e9),
-                'avg_token_time': (last_metrics['eval_duration'] / last_metrics['eval_count']) / 1e6
+                'eval_duration': eval_seconds,
+                'tokens_per_second': eval_count / eval_seconds,
+                'avg_token_time': eval_seconds * 1e3 / eval_count
             }
 
             # Create results table
@@ -149,18 +345,53 @@ class OllamaProfiler:
             console.print(table)
 
             # Save to database
-            conn = sqlite3.connect(self.db_path)
-            pd.DataFrame([run_metrics]).to_sql('performance_runs', conn, 
-                                             if_exists='append', index=False)
-            conn.close()
+            self.save_runs([run_metrics], flush=flush)
 
             return run_metrics
             
         except Exception as e:
+            # Re-check the connection before the next run
+            self._ready_urls.discard(base_url)
             console.print(f"[bold red]Error during test:[/] {str(e)}")
             console.print(f"[yellow]Response text:[/] {response.text if 'response' in locals() else 'No response'}")
             return None
 
+    def run_sweep(self, configs, base_urls=(OLLAMA_API_URL,)):
+        """Run a test for each (gpu_layers, batch_size, compute_threads) config.
+
+        Configs are dealt round-robin to the Ollama servers in base_urls.
+        Each server gets one worker thread that runs its share in order, so
+        no server sees overlapping requests. Results keep the order of configs.
+        Runs are written to the database in batches, and all of them are
+        flushed before returning.
+        """
+        configs = list(configs)
+        base_urls = list(base_urls)
+        if not base_urls:
+            raise ValueError("run_sweep needs at least one Ollama server URL")
+        n_servers = len(base_urls)
+
+        def run_share(base_url, share):
+            return [
+                self.run_test(*config, base_url=base_url, flush=False)
+                for config in share
+            ]
+
+        try:
+            with ThreadPoolExecutor(max_workers=n_servers) as pool:
+                shares = list(pool.map(
+                    run_share,
+                    base_urls,
+                    [configs[i::n_servers] for i in range(n_servers)]
+                ))
+        finally:
+            self.flush()
+
+        results = [None] * len(configs)
+        for i, share in enumerate(shares):
+            results[i::n_servers] = share
+        return results
+
     def calculate_percentage_diff(self, current, best):
         """Calculate normalized percentage difference"""
         if best == 0:
@@ -172,7 +403,7 @@ class OllamaProfiler:
         # Normalize large percentages using log scale
         if abs(pct_diff) > 20:
             sign = 1 if pct_diff > 0 else -1
-            normalized_pct = 20 + (sign * 10 * np.log10(abs(pct_diff) / 20))
+            normalized_pct = 20 + (sign * 10 * math.log10(abs(pct_diff) / 20))
             return normalized_pct
         
         return pct_diff
@@ -183,9 +414,7 @@ class OllamaProfiler:
             pct_diff = self.calculate_percentage_diff(current, best)
             
             # For metrics where lower is better, invert the sign
-            lower_is_better = metric_name in ['avg_token_time', 'total_duration', 'eval_duration', 
-                                            'load_duration', 'prompt_eval_duration']
-            if lower_is_better:
+            if metric_name in LOWER_IS_BETTER:
                 pct_diff = -pct_diff
             
             return f"{current:.3f} ({pct_diff:+.1f}%)"
@@ -204,10 +433,8 @@ class OllamaProfiler:
         for metric, weight in weights.items():
             current = metrics[metric]
             best = best_run[metric]
-            lower_is_better = metric in ['avg_token_time', 'total_duration', 'eval_duration']
-            
             # Calculate normalized score (0-1, higher is better)
-            if lower_is_better:
+            if metric in LOWER_IS_BETTER:
                 score += weight * (best / current)
             else:
                 score += weight * (current / best)
@@ -216,31 +443,40 @@ class OllamaProfiler:
 
     def show_tables_and_history(self, metrics, output_widget):
         """Display tables and history graph side by side"""
-        conn = sqlite3.connect(self.db_path)
+        # Plotting/notebook imports are heavy; load them only for the dashboard
+        import pandas as pd
+        import plotly.express as px
+        import plotly.graph_objects as go
+        from IPython.display import display, HTML
+
+        # Buffered runs are written first so they show up in the history
+        conn = self.get_connection()
         
-        # Get data for plots
+        # Get data for plots; the best run, top runs and history are all
+        # sliced from this one query
         all_runs = pd.read_sql_query("""
             SELECT * FROM performance_runs 
             ORDER BY tokens_per_second DESC
         """, conn)
         
-        # Get historical data for performance graph
-        history_data = pd.read_sql_query("""
-            SELECT 
-                timestamp,
-                tokens_per_second 
-            FROM performance_runs 
-            ORDER BY datetime(timestamp) ASC
-        """, conn)
-        
-        # Convert timestamps to datetime
-        history_data['timestamp'] = pd.to_datetime(history_data['timestamp'])
+        # Get historical data for performance graph, with datetime timestamps
+        history_data = (
+            all_runs[['timestamp', 'tokens_per_second']]
+            .sort_values('timestamp', kind='stable')
+            .assign(timestamp=lambda d: pd.to_datetime(d['timestamp'], format='ISO8601'))
+        )
         
-        # Create performance history graph
+        # Create performance history graph, downsampled so long histories
+        # stay cheap to render while keeping their shape
+        history_plot = history_data.iloc[_lttb_indices(
+            history_data['timestamp'].astype('int64').to_numpy(dtype=float),
+            history_data['tokens_per_second'].to_numpy(dtype=float),
+            HISTORY_MAX_POINTS
+        )]
         fig1 = go.Figure()
-        fig1.add_trace(go.Scatter(
-            x=history_data['timestamp'],
-            y=history_data['tokens_per_second'],
+        fig1.add_trace(go.Scattergl(
+            x=history_plot['timestamp'],
+            y=history_plot['tokens_per_second'],
             mode='lines+markers',
             name='Tokens/sec'
         ))
@@ -262,9 +498,20 @@ class OllamaProfiler:
             autosize=False
         )
         
+        # Plotted columns only, converted once and shared by the figures below;
+        # float32 is plenty for display and keeps the figure JSON small
+        plot_runs = all_runs[[
+            'gpu_layers', 'batch_size', 'compute_threads',
+            'tokens_per_second', 'avg_token_time', 'total_duration'
+        ]].astype({
+            'tokens_per_second': 'float32',
+            'avg_token_time': 'float32',
+            'total_duration': 'float32'
+        })
+
         # Create Configuration Impact 3D plot
         fig2 = px.scatter_3d(
-            all_runs,
+            plot_runs,
             x='gpu_layers',
             y='batch_size',
             z='compute_threads',
@@ -311,7 +558,7 @@ class OllamaProfiler:
         
         # Create Metric Correlations plot
         fig3 = px.scatter_matrix(
-            all_runs,
+            plot_runs,
             dimensions=['tokens_per_second', 'avg_token_time', 'total_duration'],
             color='tokens_per_second',
             color_continuous_scale='RdYlGn',
@@ -322,99 +569,8 @@ class OllamaProfiler:
             }
         )
         
-        # Create Performance Trends plot (new)
-        fig4 = make_subplots(rows=1, cols=3,
-            subplot_titles=("GPU Layers", "Batch Size", "Threads"),
-            horizontal_spacing=0.1
-        )
-        
-        # GPU Layers trend
-        fig4.add_trace(
-            go.Scatter(
-                x=all_runs['gpu_layers'],
-                y=all_runs['tokens_per_second'],
-                mode='markers',
-                name='GPU Layers',
-                marker=dict(
-                    color=all_runs['tokens_per_second'],
-                    colorscale='RdYlGn',
-                    showscale=False
-                )
-            ),
-            row=1, col=1
-        )
-        
-        # Batch Size trend
-        fig4.add_trace(
-            go.Scatter(
-                x=all_runs['batch_size'],
-                y=all_runs['tokens_per_second'],
-                mode='markers',
-                name='Batch Size',
-                marker=dict(
-                    color=all_runs['tokens_per_second'],
-                    colorscale='RdYlGn',
-                    showscale=False
-                )
-            ),
-            row=1, col=2
-        )
-        
-        # Compute Threads trend
-        fig4.add_trace(
-            go.Scatter(
-                x=all_runs['compute_threads'],
-                y=all_runs['tokens_per_second'],
-                mode='markers',
-                name='Threads',
-                marker=dict(
-                    color=all_runs['tokens_per_second'],
-                    colorscale='RdYlGn',
-                    showscale=False
-                )
-            ),
-            row=1, col=3
-        )
-        
-        # Update Performance Trends plot layout
-        fig4.update_layout(
-            height=400,
-            width=500,
-            showlegend=False,
-            margin=dict(l=40, r=20, t=30, b=40),
-            font=dict(family="Arial, sans-serif", size=12),
-            annotations=[
-                dict(x=ann.x, y=ann.y, text=ann.text, 
-                     showarrow=False, 
-                     font=dict(family="Arial, sans-serif", size=12),
-                     yshift=10,  # Move titles up
-                     yref='paper')  # Reference to the paper coordinates
-                for ann in fig4.layout.annotations
-            ]
-        )
-        
-        # Update axes for all subplots
-        for i in range(1, 4):
-            fig4.update_xaxes(
-                row=1, 
-                col=i,
-                tickmode='linear',  # Force linear tick mode
-                dtick=5 if i == 1 else (256 if i == 2 else 2),  # Custom tick intervals
-                showgrid=True
-            )
-            fig4.update_yaxes(
-                row=1,
-                col=i,
-                range=[0, max(all_runs['tokens_per_second']) * 1.1],  # Set consistent y-axis range
-                title_text="Tokens/sec" if i == 1 else None  # Only show y-axis title on first plot
-            )
-        
         # Get best run and create tables (existing code)
-        best_run = pd.read_sql_query("""
-            SELECT * FROM performance_runs 
-            ORDER BY tokens_per_second DESC 
-            LIMIT 1
-        """, conn)
+        best_run = all_runs.head(1)
         
         # Create configuration table with renamed header
         config_df = pd.DataFrame({
@@ -457,39 +613,42 @@ class OllamaProfiler:
                 best_run['load_duration'].iloc[0],
                 best_run['prompt_eval_duration'].iloc[0],
                 best_run['eval_duration'].iloc[0]
-            ],
-            'Difference': []  # Will be filled below
+            ]
         }
-        
-        # Calculate differences and arrows separately
-        arrows = []
-        for idx, row in enumerate(metric_mapping.keys()):
-            current = performance_data['Current'][idx]
-            best = performance_data['Best'][idx]
-            lower_is_better = row in ['Avg Token Time (ms)', 'Total Duration (s)', 'Load Duration (s)', 'Prompt Eval Duration (s)', 'Eval Duration (s)']
-            
-            # Calculate percentage difference relative to best
-            if lower_is_better:
-                # For metrics where lower is better
-                pct_diff = ((best - current) / best) * 100
-                is_better = current < best
-            else:
-                # For metrics where higher is better
-                pct_diff = ((current - best) / best) * 100
-                is_better = current > best
-            
-            performance_data['Difference'].append(f"{pct_diff:+.1f}%")
-            arrows.append(f'<span style="color: {("green" if is_better else "red")}">{("↑" if is_better else "↓")}</span>')
 
         # Create DataFrame with consistent formatting
         df = pd.DataFrame(performance_data)
+
+        # Percentage difference relative to best for all metrics at once,
+        # signed so that positive always means better than the best run
+        pct_diff = (df['Current'] - df['Best']) / df['Best'] * 100
+        lower_is_better = pd.Series([m in LOWER_IS_BETTER for m in metric_mapping.values()])
+        signed_pct = pct_diff.where(~lower_is_better, -pct_diff)
+        df['Difference'] = signed_pct.map('{:+.1f}%'.format)
+        # Cell colors follow the displayed (rounded) difference
+        metric_colors = [
+            self.get_gradient_color(diff, -20, 20) for diff in signed_pct.round(1)
+        ]
+        metric_rows = ''.join(
+            METRIC_ROW_TEMPLATE.format(metric, current, best, color, difference)
+            for (metric, current, best, difference), color
+            in zip(df.itertuples(index=False, name=None), metric_colors)
+        )
         
         # Get top 10 best runs
-        top_runs = pd.read_sql_query("""
-            SELECT * FROM performance_runs 
-            ORDER BY tokens_per_second DESC 
-            LIMIT 10
-        """, conn)
+        top_runs = all_runs.head(10)
+        top_run_rows = ''.join(
+            TOP_RUN_ROW_TEMPLATE.format(*row)
+            for row in zip(
+                pd.to_datetime(top_runs['timestamp'], format='ISO8601').dt.strftime('%Y-%m-%d %H:%M'),
+                top_runs['gpu_layers'],
+                top_runs['batch_size'],
+                top_runs['compute_threads'],
+                top_runs['tokens_per_second'],
+                top_runs['avg_token_time'],
+                top_runs['total_duration']
+            )
+        )
 
         # Simplify the HTML/CSS structure first
         html_content = f"""
@@ -548,6 +707,9 @@ class OllamaProfiler:
                 .content-row {{
                     margin: 0 0 20px 0;
                 }}
+                .config-3d-graph > div {{
+                    margin-top: -80px !important;  /* Force top margin for 3D graph */
+                }}
                 .graph-container {{
                     width: 700px;
                     margin-left: -170px;
@@ -621,16 +783,7 @@ class OllamaProfiler:
                                     <tr style="background-color: #f5f5f5;">
                                         <td colspan="4" style="padding: 8px; font-weight: bold;">Metrics</td>
                                     </tr>
-                                    {''.join(f"""
-                                        <tr>
-                                            <td>{row['Metric']}</td>
-                                            <td>{row['Current']:.3f}</td>
-                                            <td>{row['Best']:.3f}</td>
-                                            <td style="background: {self.get_gradient_color(float(row['Difference'].strip('%+').strip(')')), -20, 20)}">
-                                                {row['Difference']}
-                                            </td>
-                                        </tr>
-                                    """ for i, row in df.iterrows())}
+                                    {metric_rows}
                                 </tbody>
                             </table>
                             <div class="color-bar-container">
@@ -659,17 +812,7 @@ class OllamaProfiler:
                                 </tr>
                             </thead>
                             <tbody>
-                                {''.join(f"""
-                                    <tr>
-                                        <td>{datetime.strptime(row['timestamp'].replace('T', ' '), '%Y-%m-%d %H:%M:%S.%f').strftime('%Y-%m-%d %H:%M')}</td>
-                                        <td>{row['gpu_layers']}</td>
-                                        <td>{row['batch_size']}</td>
-                                        <td>{row['compute_threads']}</td>
-                                        <td>{row['tokens_per_second']:.3f}</td>
-                                        <td>{row['avg_token_time']:.3f}</td>
-                                        <td>{row['total_duration']:.3f}</td>
-                                    </tr>
-                                """ for _, row in top_runs.iterrows())}
+                                {top_run_rows}
                             </tbody>
                         </table>
                     </div>
@@ -679,14 +822,14 @@ class OllamaProfiler:
                 <div>
                     <div class="section-title">Configuration Impact</div>
                     <div class="graph-container content-row config-3d-graph">
-                        {fig2.to_html(full_html=False, include_plotlyjs='cdn')}
+                        {fig2.to_html(full_html=False, include_plotlyjs='cdn')}  <!-- loads plotly.js for all figures -->
                     </div>
                 </div>
                 
                 <div>
                     <div class="section-title">Performance History</div>
                     <div class="history-graph-container content-row">
-                        {fig1.to_html(full_html=False, include_plotlyjs='cdn')}
+                        {fig1.to_html(full_html=False, include_plotlyjs=False)}
                     </div>
                 </div>
             </div>
@@ -699,58 +842,47 @@ class OllamaProfiler:
                     width=1110,  # Match exact width of the two tables + gap
                     margin=dict(l=50, r=50, t=20, b=50),
                     showlegend=False
-                ).to_html(full_html=False, include_plotlyjs='cdn')}
+                ).to_html(full_html=False, include_plotlyjs=False)}
             </div>
         """
         
-        # Remove the padding from the container div
-        html_content = html_content.replace('style="padding-right: 20px;"', '')
-
-        # Add CSS for the 3D graph specifically
-        html_content = html_content.replace(
-            '.graph-container {',
-            '''
-                .config-3d-graph > div {
-                    margin-top: -80px !important;  /* Force top margin for 3D graph */
-                }
-                .graph-container {
-                    width: 700px;
-                    margin-left: -170px;
-                    overflow-y: hidden;
-                    overflow-x: hidden;
-                }
-            '''
-        )
-
-        # Update section title style
-        html_content = html_content.replace(
-            '.section-title {',
-            '''
-                .section-title {
-                    font-family: Arial, sans-serif;
-                    font-size: 16px;
-                    margin: 0 0 10px 0;
-                    text-align: left;
-                    margin-top: 16px;
-                }
-            '''
-        )
-
         # Single display call with complete layout
         display(HTML(html_content))
-        
-        conn.close()
 
     def show_comparison(self, metrics):
         """Original method now calls only tables and history"""
         self.show_tables_and_history(metrics)
 
-    def generate_recommendations(self, all_runs, current_metrics):
-        """Generate configuration recommendations based on historical data"""
+    def _top_mode(self, conn, column, top_n=3):
+        """Most common value of a config column among the top_n fastest runs.
+
+        Ties go to the smallest value. Returns None when there are no runs.
+        """
+        if column not in CONFIG_COLUMNS:
+            raise ValueError(f"Unknown config column: {column}")
+        row = conn.execute(f"""
+            SELECT {column} FROM (
+                SELECT {column} FROM performance_runs
+                ORDER BY tokens_per_second DESC
+                LIMIT ?
+            )
+            GROUP BY {column}
+            ORDER BY COUNT(*) DESC, {column} ASC
+            LIMIT 1
+        """, (top_n,)).fetchone()
+        return row[0] if row else None
+
+    def generate_recommendations(self, current_metrics):
+        """Generate configuration recommendations from the three fastest runs"""
         recommendations = []
+        conn = self.get_connection()
+        best_gpu, best_batch, best_threads = (
+            self._top_mode(conn, column) for column in CONFIG_COLUMNS
+        )
+        if best_gpu is None:
+            return recommendations
         
         # Analyze GPU layers impact
-        best_gpu = all_runs.nlargest(3, 'tokens_per_second')['gpu_layers'].mode()[0]
         if current_metrics['gpu_layers'] != best_gpu:
             recommendations.append(
                 f"Consider adjusting GPU layers to {best_gpu} "
@@ -758,7 +890,6 @@ class OllamaProfiler:
             )
         
         # Analyze batch size impact
-        best_batch = all_runs.nlargest(3, 'tokens_per_second')['batch_size'].mode()[0]
         if current_metrics['batch_size'] != best_batch:
             recommendations.append(
                 f"Try batch size of {best_batch} "
@@ -766,7 +897,6 @@ class OllamaProfiler:
             )
         
         # Analyze thread count impact
-        best_threads = all_runs.nlargest(3, 'tokens_per_second')['compute_threads'].mode()[0]
         if current_metrics['compute_threads'] != best_threads:
             recommendations.append(
                 f"Experiment with {best_threads} compute threads "
@@ -775,12 +905,14 @@ class OllamaProfiler:
         
         return recommendations
 
-    def get_gradient_color(self, diff, min_diff=-100, max_diff=100):
-        """Get gradient color based on difference"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_gradient_color(diff, min_diff=-100, max_diff=100):
+        """Get gradient color based on difference (memoized; inputs repeat across renders)"""
         # Normalize difference to -1 to 1 scale with non-linear scaling
-        norm_diff = np.clip(diff / max(abs(min_diff), abs(max_diff)), -1, 1)
+        norm_diff = min(max(diff / max(abs(min_diff), abs(max_diff)), -1), 1)
         # Apply exponential scaling to increase color contrast
-        norm_diff = np.sign(norm_diff) * (abs(norm_diff) ** 0.5)
+        norm_diff = math.copysign(abs(norm_diff) ** 0.5, norm_diff)
         
         if norm_diff > 0:
             # Green gradient for positive
@@ -791,17 +923,24 @@ class OllamaProfiler:
 
 def main():
     parser = argparse.ArgumentParser(description='Ollama Performance Profiler')
-    parser.add_argument('--gpu-layers', type=int, default=35,
-                      help='Number of GPU layers (default: 35)')
-    parser.add_argument('--batch-size', type=int, default=1024,
-                      help='Batch size (default: 1024)')
-    parser.add_argument('--compute-threads', type=int, default=8,
-                      help='Number of compute threads (default: 8)')
+    parser.add_argument('--gpu-layers', type=int, nargs='+', default=[35],
+                      help='Number of GPU layers; several values sweep a grid (default: 35)')
+    parser.add_argument('--batch-size', type=int, nargs='+', default=[1024],
+                      help='Batch size; several values sweep a grid (default: 1024)')
+    parser.add_argument('--compute-threads', type=int, nargs='+', default=[8],
+                      help='Number of compute threads; several values sweep a grid (default: 8)')
+    parser.add_argument('--server', action='append', dest='servers', metavar='URL',
+                      help=f'Ollama server URL, repeat to spread a sweep across servers '
+                           f'(default: {OLLAMA_API_URL})')
     
     args = parser.parse_args()
+    configs = list(product(args.gpu_layers, args.batch_size, args.compute_threads))
     
     profiler = OllamaProfiler()
-    profiler.run_test(args.gpu_layers, args.batch_size, args.compute_threads)
+    try:
+        profiler.run_sweep(configs, base_urls=args.servers or [OLLAMA_API_URL])
+    finally:
+        profiler.close()
 
 if __name__ == "__main__":
     main()
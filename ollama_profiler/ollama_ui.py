@@ -1,13 +1,10 @@
 from ollama_profiler import OllamaProfiler
 import ipywidgets as widgets
 from IPython.display import display, clear_output, HTML
-import time
-import sqlite3
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 import sys
-from pathlib import Path
+
+# One recommendation in the results list
+RECOMMENDATION_ITEM = '<li style="margin-bottom: 5px;">{}</li>'
 
 def setup_environment():
     """Setup environment for the UI"""
@@ -75,22 +72,13 @@ def create_ui():
                     # Show tables and history graph side by side
                     profiler.show_tables_and_history(metrics, output)
                     
-                    # Show recommendations
-                    conn = sqlite3.connect(profiler.db_path)
-                    all_runs = pd.read_sql_query("""
-                        SELECT * FROM performance_runs 
-                        ORDER BY tokens_per_second DESC
-                    """, conn)
-                    
                     # Show recommendations only
-                    recommendations = profiler.generate_recommendations(all_runs, metrics)
+                    recommendations = profiler.generate_recommendations(metrics)
                     display(HTML(f"""
                     <ul style='margin-top: 10px;'>
-                        {''.join(f'<li style="margin-bottom: 5px;">{r}</li>' for r in recommendations)}
+                        {''.join([RECOMMENDATION_ITEM.format(r) for r in recommendations])}
                     </ul>
                     """))
-                    
-                    conn.close()
                 
                 status.value = "<span style='color: green'>Test completed successfully</span>"
             else:
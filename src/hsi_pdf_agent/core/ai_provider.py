@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 import logfire
 import httpx
@@ -25,12 +26,102 @@ class AIProvider(ABC):
     async def complete(self, messages: List[Message], **kwargs) -> ChatResponse:
         pass
 
+    async def stream(self, messages: List[Message], **kwargs) -> AsyncIterator[str]:
+        """Yield the response text as it is generated.
+
+        Providers without native streaming yield the full answer at once.
+        """
+        response = await self.complete(messages, **kwargs)
+        yield response.answer
+
 class OllamaProvider(AIProvider):
     """Provider for Ollama API."""
     def __init__(self, base_url: str = "http://host.docker.internal:11434", timeout: int = 10):
         self.base_url = base_url
         self.timeout = timeout
-        
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to Ollama alive across requests.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                # Set specific timeouts for connect, read, and write operations
+                timeout=httpx.Timeout(
+                    connect=5.0,    # Connection timeout
+                    read=10.0,      # Read timeout
+                    write=5.0,      # Write timeout
+                    pool=5.0        # Pool timeout
+                ),
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def stream(self, messages: List[Message], **kwargs) -> AsyncIterator[str]:
+        """Stream message content from the Ollama chat API chunk by chunk."""
+        request_data = {
+            "model": kwargs.get("model", "deepseek-r1:7b"),
+            "messages": [
+                {"role": msg.role, "content": msg.content}
+                for msg in messages
+            ],
+            "stream": True
+        }
+        logfire.info("starting_ollama_stream", message_count=len(messages))
+
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                json=request_data
+            ) as response:
+                if not response.is_success:
+                    error_text = (await response.aread()).decode()
+                    logfire.error(
+                        "ollama_error_response",
+                        status_code=response.status_code,
+                        error_body=error_text
+                    )
+                    raise ValueError(f"Ollama error response: {error_text}")
+
+                in_think_block = False
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                    except json.JSONDecodeError:
+                        logfire.error("line_parse_error", line_preview=line[:100])
+                        continue
+
+                    content = chunk.get("message", {}).get("content", "")
+                    if content == "<think>":
+                        in_think_block = True
+                    elif content == "</think>":
+                        in_think_block = False
+                    elif content and not in_think_block:
+                        yield content
+
+                    if chunk.get("done", False):
+                        break
+        except httpx.ConnectError:
+            logfire.error(
+                "ollama_connection_error",
+                message="Could not connect to Ollama service. Is it running?"
+            )
+            raise ValueError(
+                "Could not connect to Ollama service. Please ensure Ollama is running on port 11434"
+            )
+
     async def complete(self, messages: List[Message], **kwargs) -> ChatResponse:
         formatted_messages = [
             {"role": msg.role, "content": msg.content}
@@ -44,159 +135,166 @@ class OllamaProvider(AIProvider):
         )
         
         try:
-            # Set specific timeouts for connect, read, and write operations
-            timeout = httpx.Timeout(
-                connect=5.0,    # Connection timeout
-                read=10.0,      # Read timeout
-                write=5.0,      # Write timeout
-                pool=5.0        # Pool timeout
+            client = self._get_client()
+            request_data = {
+                "model": kwargs.get("model", "deepseek-r1:7b"),
+                "messages": formatted_messages
+            }
+            logfire.info("ollama_request_prepared", 
+                url=f"{self.base_url}/api/chat",
+                request_data=request_data
             )
-            
-            logfire.info("creating_http_client")
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                request_data = {
-                    "model": kwargs.get("model", "deepseek-r1:7b"),
-                    "messages": formatted_messages
-                }
-                logfire.info("ollama_request_prepared", 
-                    url=f"{self.base_url}/api/chat",
-                    request_data=request_data
-                )
-                
-                logfire.info("sending_request")
-                try:
-                    response = await client.post(
-                        f"{self.base_url}/api/chat",
-                        json=request_data
-                    )
-                except httpx.ConnectError:
-                    logfire.error(
-                        "ollama_connection_error",
-                        message="Could not connect to Ollama service. Is it running?"
-                    )
-                    raise ValueError(
-                        "Could not connect to Ollama service. Please ensure Ollama is running on port 11434"
-                    )
-                logfire.info("received_response", status_code=response.status_code)
                 
-                if not response.is_success:
-                    error_body = await response.aread()
-                    error_text = error_body.decode()
-                    logfire.error(
-                        "ollama_error_response", 
-                        status_code=response.status_code,
-                        error_body=error_text,
-                        request_data=request_data
-                    )
-                    raise ValueError(f"Ollama error response: {error_text}")
+            logfire.info("sending_request")
+            try:
+                response = await client.post(
+                    f"{self.base_url}/api/chat",
+                    json=request_data
+                )
+            except httpx.ConnectError:
+                logfire.error(
+                    "ollama_connection_error",
+                    message="Could not connect to Ollama service. Is it running?"
+                )
+                raise ValueError(
+                    "Could not connect to Ollama service. Please ensure Ollama is running on port 11434"
+                )
+            logfire.info("received_response", status_code=response.status_code)
                 
-                # Get raw response text first
-                response_bytes = await response.aread()
-                raw_response = response_bytes.decode()
-                logfire.info("raw_response_debug", 
-                    response_preview=raw_response[:200],
-                    response_length=len(raw_response),
-                    has_content=bool(raw_response.strip()),
-                    first_line=raw_response.split('\n')[0] if raw_response else None
+            if not response.is_success:
+                error_body = await response.aread()
+                error_text = error_body.decode()
+                logfire.error(
+                    "ollama_error_response", 
+                    status_code=response.status_code,
+                    error_body=error_text,
+                    request_data=request_data
                 )
+                raise ValueError(f"Ollama error response: {error_text}")
                 
-                try:
-                    # Handle Ollama's streaming response format
-                    full_response = ""
-                    in_think_block = False
-                    line_count = 0
-                    for line in raw_response.splitlines():
-                        line_count += 1
-                        if not line.strip():
-                            continue
-                        try:
-                            chunk = json.loads(line)
-                            logfire.info("processing_chunk", 
-                                has_response="response" in chunk,
-                                has_message="message" in chunk,
-                                content=chunk.get("message", {}).get("content", "")[:50],
-                                line_number=line_count,
-                                done=chunk.get("done", False)
-                            )
+            # Get raw response text first
+            response_bytes = await response.aread()
+            raw_response = response_bytes.decode()
+            logfire.info("raw_response_debug", 
+                response_preview=raw_response[:200],
+                response_length=len(raw_response),
+                has_content=bool(raw_response.strip()),
+                first_line=raw_response.split('\n')[0] if raw_response else None
+            )
+                
+            try:
+                # Handle Ollama's streaming response format
+                full_response = ""
+                in_think_block = False
+                line_count = 0
+                for line in raw_response.splitlines():
+                    line_count += 1
+                    if not line.strip():
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                        logfire.info("processing_chunk", 
+                            has_response="response" in chunk,
+                            has_message="message" in chunk,
+                            content=chunk.get("message", {}).get("content", "")[:50],
+                            line_number=line_count,
+                            done=chunk.get("done", False)
+                        )
                             
-                            # Only process message content
-                            if "message" in chunk and "content" in chunk["message"]:
-                                content = chunk["message"]["content"]
+                        # Only process message content
+                        if "message" in chunk and "content" in chunk["message"]:
+                            content = chunk["message"]["content"]
                                 
-                                # Handle think tags (both escaped and unescaped)
-                                if content == "<think>" or content == "\u003cthink\u003e":
-                                    in_think_block = True
-                                    continue
-                                elif content == "</think>" or content == "\u003c/think\u003e":
-                                    in_think_block = False
-                                    continue
+                            # Handle think tags (both escaped and unescaped)
+                            if content == "<think>" or content == "\u003cthink\u003e":
+                                in_think_block = True
+                                continue
+                            elif content == "</think>" or content == "\u003c/think\u003e":
+                                in_think_block = False
+                                continue
                                 
-                                if not in_think_block:
-                                    full_response += content
+                            if not in_think_block:
+                                full_response += content
                                 
-                            # If this is the final message, break
-                            if chunk.get("done", False):
-                                break
-                        except json.JSONDecodeError:
-                            logfire.error("line_parse_error", 
-                                line_preview=line[:100],
-                                line_number=line_count
-                            )
-                            continue
-                except json.JSONDecodeError:
-                    logfire.error("json_decode_error", response=raw_response[:200])
-                    raise ValueError("Invalid JSON response from Ollama")
-                
-                if not full_response:
-                    logfire.error("empty_response", message="No valid content received from Ollama")
-                    raise ValueError("No valid content received from Ollama")
+                        # If this is the final message, break
+                        if chunk.get("done", False):
+                            break
+                    except json.JSONDecodeError:
+                        logfire.error("line_parse_error", 
+                            line_preview=line[:100],
+                            line_number=line_count
+                        )
+                        continue
+            except json.JSONDecodeError:
+                logfire.error("json_decode_error", response=raw_response[:200])
+                raise ValueError("Invalid JSON response from Ollama")
                 
-                full_response = full_response.strip()
+            if not full_response:
+                logfire.error("empty_response", message="No valid content received from Ollama")
+                raise ValueError("No valid content received from Ollama")
                 
-                # Extract JSON from code block if present
-                if full_response.startswith("```json"):
-                    try:
-                        # Extract content between ```json and the next ```
-                        json_text = full_response.split("```json\n", 1)[1].split("```", 1)[0].strip()
-                        full_response = json_text
-                    except IndexError:
-                        logfire.error("code_block_parse_error", 
-                            response_preview=full_response[:200]
-                        )
+            full_response = full_response.strip()
                 
-                # Ensure we have a valid JSON response with required fields
+            # Extract JSON from code block if present
+            if full_response.startswith("```json"):
                 try:
-                    # If response is already JSON, parse it
-                    json_data = json.loads(full_response)
-                except json.JSONDecodeError:
-                    # If not JSON, create a default structure
-                    json_data = {
-                        "findings": {
-                            "recommendations": [],
-                            "summary": "No analysis available.",
-                            "technical_details": "No detailed analysis available."
-                        }
-                    }
-                    logfire.error("invalid_json_format", 
-                        response_preview=full_response[:200],
-                        error="Response was not in JSON format"
+                    # Extract content between ```json and the next ```
+                    json_text = full_response.split("```json\n", 1)[1].split("```", 1)[0].strip()
+                    full_response = json_text
+                except IndexError:
+                    logfire.error("code_block_parse_error", 
+                        response_preview=full_response[:200]
                     )
                 
-                # Ensure all required fields are present
-                if "findings" not in json_data:
-                    json_data = {"findings": json_data}
-                if "technical_details" not in json_data["findings"]:
-                    json_data["findings"]["technical_details"] = "Technical details not provided"
-                if "recommendations" not in json_data["findings"]:
-                    json_data["findings"]["recommendations"] = []
-                if "summary" not in json_data["findings"]:
-                    json_data["findings"]["summary"] = "Summary not provided"
-                    
-                return ChatResponse(
-                    content=json.dumps(json_data),
-                    context_sections=[]
+            # Ensure we have a valid JSON response with required fields
+            try:
+                # If response is already JSON, parse it
+                json_data = json.loads(full_response)
+            except json.JSONDecodeError:
+                # If not JSON, create a default structure
+                json_data = {
+                    "findings": {
+                        "recommendations": [],
+                        "summary": "No analysis available.",
+                        "technical_details": "No detailed analysis available."
+                    }
+                }
+                logfire.error("invalid_json_format", 
+                    response_preview=full_response[:200],
+                    error="Response was not in JSON format"
                 )
                 
+            # Ensure all required fields are present
+            if "findings" not in json_data:
+                json_data = {"findings": json_data}
+            if "technical_details" not in json_data["findings"]:
+                json_data["findings"]["technical_details"] = "Technical details not provided"
+            if "recommendations" not in json_data["findings"]:
+                json_data["findings"]["recommendations"] = []
+            if "summary" not in json_data["findings"]:
+                json_data["findings"]["summary"] = "Summary not provided"
+                    
+            return ChatResponse(
+                content=json.dumps(json_data),
+                context_sections=[]
+            )
+                
         except Exception as e:
             logfire.error("ollama_request_error", error=str(e), error_type=type(e).__name__)
-            raise ValueError(f"Failed to communicate with Ollama: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to communicate with Ollama: {str(e)}") 
+
+
+@lru_cache(maxsize=1)
+def get_ollama_provider() -> OllamaProvider:
+    """Get the Ollama provider shared by the whole app, created on first use.
+
+    Call ``close_ollama_provider()`` on shutdown to release its HTTP client.
+    """
+    return OllamaProvider()
+
+
+async def close_ollama_provider() -> None:
+    """Close the shared Ollama provider if it was created."""
+    if get_ollama_provider.cache_info().currsize:
+        await get_ollama_provider().aclose()
+        get_ollama_provider.cache_clear()
@@ -1,11 +1,12 @@
-from typing import List, Optional, cast, Literal, TypedDict
+from typing import AsyncIterator, List, Optional, cast, Literal, TypedDict
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 import logfire
 from pydantic import BaseModel
 
 from hsi_pdf_agent.models.chat import Message, Conversation
-from .ai_provider import AIProvider, OllamaProvider
+from .ai_provider import AIProvider, get_ollama_provider
+from .vector_store import VectorStore
 
 MessageRole = Literal["user", "assistant", "system"]
 
@@ -19,15 +20,37 @@ class OpenAIMessage(TypedDict):
 class ChatService:
     """Service for handling chat operations."""
 
-    def __init__(self, provider: Optional[AIProvider] = None):
-        self.provider = provider or OllamaProvider()
+    def __init__(
+        self,
+        provider: Optional[AIProvider] = None,
+        vector_store: Optional[VectorStore] = None
+    ):
+        self.provider = provider or get_ollama_provider()
+        self.vector_store = vector_store
+
+    async def get_relevant_context_batch(
+        self,
+        questions: List[str],
+        top_k: int = 3
+    ) -> List[List[str]]:
+        """Get the most relevant stored sections for each question.
+
+        Uses one batched vector store round-trip for all questions.
+        """
+        if self.vector_store is None:
+            raise ValueError("ChatService has no vector store configured")
+        results = await self.vector_store.search_batch(questions, top_k=top_k)
+        return [
+            [entry.content for _, entry in matches]
+            for matches in results
+        ]
 
     async def create_conversation(self, title: str) -> Conversation:
         """Create a new conversation."""
         conversation = Conversation(
             id=uuid4(),
             title=title,
-            updated_at=datetime.utcnow()
+            updated_at=datetime.now(timezone.utc)
         )
         logfire.info(
             "conversation_created",
@@ -46,7 +69,7 @@ class ChatService:
             id=str(uuid4()),
             role=role,
             content=content,
-            updated_at=datetime.utcnow()
+            updated_at=datetime.now(timezone.utc)
         )
         conversation.messages.append(message)
         logfire.info(
@@ -64,12 +87,14 @@ class ChatService:
         max_context_sections: int = 3
     ) -> Message:
         """Generate a response to a question."""
+        # One timestamp for both messages of this exchange
+        now = datetime.now(timezone.utc)
         messages = [
             Message(
                 id=str(uuid4()),
                 role="user",
                 content=question,
-                updated_at=datetime.utcnow()
+                updated_at=now
             )
         ]
         if conversation:
@@ -89,7 +114,7 @@ class ChatService:
             id=str(uuid4()),
             role="assistant",
             content=answer,
-            updated_at=datetime.utcnow()
+            updated_at=now
         )
 
         if conversation:
@@ -103,6 +128,56 @@ class ChatService:
         )
         return message
 
+    async def generate_response_stream(
+        self,
+        question: str,
+        conversation: Optional[Conversation] = None
+    ) -> AsyncIterator[str]:
+        """Stream a response to a question as it is generated.
+
+        The complete answer is added to the conversation once the stream ends.
+        """
+        # One timestamp for both messages of this exchange
+        now = datetime.now(timezone.utc)
+        messages = [
+            Message(
+                id=str(uuid4()),
+                role="user",
+                content=question,
+                updated_at=now
+            )
+        ]
+        if conversation:
+            messages.extend(conversation.messages)
+
+        from .ai_provider import Message as AIMessage
+        chat_messages = [
+            AIMessage(role=msg.role, content=msg.content)
+            for msg in messages
+        ]
+
+        parts: List[str] = []
+        async for chunk in self.provider.stream(chat_messages):
+            parts.append(chunk)
+            yield chunk
+
+        message = Message(
+            id=str(uuid4()),
+            role="assistant",
+            content="".join(parts),
+            updated_at=now
+        )
+
+        if conversation:
+            conversation.messages.append(message)
+
+        logfire.info(
+            "response_streamed",
+            question=question,
+            response_id=message.id,
+            conversation_id=str(conversation.id) if conversation else None
+        )
+
     async def get_completion(self, messages: List[Message], **kwargs) -> str:
         # Convert our Message objects to the format expected by the provider
         from .ai_provider import Message as AIMessage
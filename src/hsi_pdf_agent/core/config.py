@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         DATA_DIR: Directory for application data files
         PDF_DIR: Directory for PDF files
         DIAGRAMS_DIR: Directory for diagram files
+        CACHE_DIR: Directory for cached parse results
         FRONTEND_PUBLIC_DIR: Directory for frontend public static assets
         FRONTEND_DIAGRAMS_DIR: Directory for frontend diagram files
         admin_username: Username for admin access
@@ -72,36 +73,37 @@ class Settings(BaseSettings):
         description="Directory for application data files"
     )
 
+    # Derived directories, resolved and created once in model_post_init
+    PDF_DIR: Path = Field(
+        default_factory=lambda data: data["DATA_DIR"] / "pdfs",
+        description="Directory for PDF files"
+    )
+    CACHE_DIR: Path = Field(
+        default_factory=lambda data: data["DATA_DIR"] / "cache",
+        description="Directory for cached PDF parse results"
+    )
+    FRONTEND_PUBLIC_DIR: Path = Field(
+        default_factory=lambda: Settings.BASE_DIR / "frontend" / "public",
+        description="Frontend public directory for static assets"
+    )
+    DIAGRAMS_DIR: Path = Field(
+        default_factory=lambda data: data["FRONTEND_PUBLIC_DIR"] / "diagrams",
+        description="Directory for diagram files"
+    )
+
     @computed_field
     def PROJECT_ROOT(self) -> Path:
         """Get the project root directory."""
         return self.BASE_DIR
 
-    @computed_field
-    def PDF_DIR(self) -> Path:
-        """Get PDF directory and ensure it exists."""
-        pdf_dir = self.DATA_DIR / "pdfs"
-        pdf_dir.mkdir(parents=True, exist_ok=True)
-        return pdf_dir
-
-    @computed_field
-    def DIAGRAMS_DIR(self) -> Path:
-        """Get diagrams directory and ensure it exists."""
-        diagrams_dir = self.FRONTEND_PUBLIC_DIR / "diagrams"
-        diagrams_dir.mkdir(parents=True, exist_ok=True)
-        return diagrams_dir
-
-    @computed_field
-    def FRONTEND_PUBLIC_DIR(self) -> Path:
-        """Get frontend public directory for static assets."""
-        public_dir = self.BASE_DIR / "frontend" / "public"
-        public_dir.mkdir(parents=True, exist_ok=True)
-        return public_dir
-
     def model_post_init(self, context: Any) -> None:
-        """Ensure data directory exists and is absolute."""
+        """Resolve the configured directories and ensure they exist."""
         self.DATA_DIR = self.DATA_DIR.resolve()
         self.DATA_DIR.mkdir(exist_ok=True)
+        for name in ("PDF_DIR", "CACHE_DIR", "FRONTEND_PUBLIC_DIR", "DIAGRAMS_DIR"):
+            path = getattr(self, name).resolve()
+            path.mkdir(parents=True, exist_ok=True)
+            setattr(self, name, path)
 
 
 @lru_cache
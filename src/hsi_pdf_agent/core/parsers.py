@@ -1,7 +1,13 @@
 """PDF parsing utilities."""
+import re
 from ..models.pdf import SpecValue
 from typing import Dict, List, Optional, Union, Any, cast
 
+# A bullet point: a run between bullets, trimmed of surrounding whitespace
+_POINT_RE = re.compile(r'[^•\s](?:[^•]*[^•\s])?')
+# Any whitespace inside a stripped point means it has more than one word
+_WHITESPACE_RE = re.compile(r'\s')
+
 
 class PDFSectionParser:
     """Parser for PDF sections."""
@@ -24,32 +30,20 @@ class PDFSectionParser:
 
         if isinstance(content, list) and content:
             if isinstance(content[0], str):
-                # Handle text content
-                for line in cast(List[str], content):
-                    if "•" in line:
-                        # Handle bulleted content
-                        for point in line.split("•"):
-                            if point.strip():
-                                points.append(point.strip())
-                    else:
-                        # Handle non-bulleted content
-                        if line.strip():
-                            points.append(line.strip())
+                # Handle text content: each line is split at its bullets (a
+                # line without bullets is one point), so join the lines with a
+                # bullet and tokenize everything in one pass
+                points = _POINT_RE.findall("•".join(cast(List[str], content)))
             else:
                 # Handle table content
                 for row in cast(List[List[Any]], content):
                     if row and row[0]:
                         points.append(str(row[0]).strip())
 
-        # Clean up points
-        cleaned_points: List[str] = []
-        seen = set()
-        for point in points:
-            if point not in seen and len(point.split()) > 1:
-                cleaned_points.append(point)
-                seen.add(point)
-
-        return cleaned_points
+        # Clean up points: keep multi-word points, first occurrence only
+        return list(dict.fromkeys(
+            point for point in points if _WHITESPACE_RE.search(point)
+        ))
 
     def _parse_table_specs(
         self,
@@ -1,4 +1,10 @@
 """Service for comparing PDF specifications."""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import pandas as pd
 
@@ -9,13 +15,59 @@ from hsi_pdf_agent.models.ai_findings import AIFindings
 from hsi_pdf_agent.models.features import ModelSpecs
 
 
+def _process_pdf(model_num: str) -> PDFData:
+    """Parse a model's PDF with a fresh processor (runs in a worker process)."""
+    return PDFProcessor().process_pdf(model_num)
+
+
+# Upper bound on PDF parsing workers, each of which holds its own PyMuPDF state
+_MAX_PDF_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for PDF parsing, created on first use.
+
+    Workers are spawned rather than forked, since forking a threaded
+    process can deadlock.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(_MAX_PDF_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_pdf_pool() -> None:
+    """Shut down the PDF parsing pool if it was started."""
+    if _get_pdf_pool.cache_info().currsize:
+        _get_pdf_pool().shutdown(cancel_futures=True)
+        _get_pdf_pool.cache_clear()
+
+
+async def load_model_data(model_num: str) -> PDFData:
+    """Process the PDF for a model number.
+
+    Parsing runs in a worker process so several PDFs can be parsed in
+    parallel without contending for the GIL. Repeat requests are served from
+    PDFProcessor's on-disk cache, which is checked against the PDF's mtime
+    and size, so replaced PDFs are picked up by every app process.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, _process_pdf, model_num)
+    except BrokenProcessPool:
+        # A worker died (e.g. PyMuPDF crashed on a bad PDF); start a fresh
+        # pool so later comparisons still work, and retry once. Another
+        # request may already have replaced the broken pool.
+        if _get_pdf_pool() is pool:
+            shutdown_pdf_pool()
+        return await loop.run_in_executor(_get_pdf_pool(), _process_pdf, model_num)
+
+
 class ComparisonProcessor:
     """Processor for comparing PDFs."""
 
-    def __init__(self) -> None:
-        """Initialize the comparison processor."""
-        self.pdf_processor = PDFProcessor()
-
     def _convert_to_model_specs(self, name: str, data: PDFData) -> ModelSpecs:
         """Convert PDFData to ModelSpecs."""
         features_advantages: Dict[str, List[str]] = {}
@@ -40,7 +92,7 @@ class ComparisonProcessor:
     async def compare_models(self, model_numbers: List[str]) -> ComparisonResult:
         """Compare specifications between multiple models."""
         # Collect model data
-        models = self._collect_model_data(model_numbers)
+        models, model_names = await self._collect_model_data(model_numbers)
         if not models:
             return ComparisonResult(
                 features_df=pd.DataFrame(),
@@ -53,11 +105,11 @@ class ComparisonProcessor:
         sections = self._get_ordered_sections(models)
 
         # Process features and advantages
-        features_df = self._process_features(models, model_numbers)
-        advantages_df = self._process_advantages(models, model_numbers)
+        features_df = self._process_features(models, model_names)
+        advantages_df = self._process_advantages(models, model_names)
 
         # Process specifications
-        specs_df, spec_differences = self._process_specifications(models, model_numbers, sections)
+        specs_df, spec_differences = self._process_specifications(models, model_names, sections)
 
         # Generate AI analysis if there are differences
         ai_findings: Optional[AIFindings] = None
@@ -77,32 +129,35 @@ class ComparisonProcessor:
                 key = f"{category_str} - {spec_str}"
                 analysis_data[key] = values
 
-            ai_findings = await AIFindings.analyze(model_numbers, analysis_data)
+            ai_findings = await AIFindings.analyze(model_names, analysis_data)
 
         return ComparisonResult(
             features_df=features_df,
             advantages_df=advantages_df,
             specs_df=specs_df,
             spec_differences_df=pd.DataFrame(spec_differences) if spec_differences else pd.DataFrame(),
-            findings=ai_findings
+            findings=ai_findings,
+            model_names=model_names
         )
 
-    def _collect_model_data(self, model_numbers: List[str]) -> Dict[str, PDFData]:
-        """Collect PDF data for each model."""
-        models: Dict[str, PDFData] = {}
-        # Create mapping of input model numbers to full model names
-        model_name_map = {}
-        for model_num in model_numbers:
-            result = self.pdf_processor.process_pdf(model_num)
-            full_model = result.model_name.split('-')[1]  # e.g., "980R" from "HSR-980R"
-            models[full_model] = result
-            model_name_map[model_num] = full_model
-        
-        # Update the model_numbers list with full model names
-        for i, num in enumerate(model_numbers):
-            model_numbers[i] = model_name_map[num]
-            
-        return models
+    async def _collect_model_data(
+        self,
+        model_numbers: List[str]
+    ) -> tuple[Dict[str, PDFData], List[str]]:
+        """Collect PDF data for each model.
+
+        Returns:
+            The parsed data keyed by full model name, and the full model
+            names in the same order as ``model_numbers``.
+        """
+        # Wait on the process-pool parses concurrently
+        results = await asyncio.gather(*(
+            load_model_data(model_num) for model_num in model_numbers
+        ))
+        # e.g., "980R" from "HSR-980R"
+        full_names = [result.model_name.split('-', 1)[1] for result in results]
+        models = dict(zip(full_names, results))
+        return models, full_names
 
     def _get_ordered_sections(self, models: Dict[str, PDFData]) -> List[str]:
         """Get sections in order from the first model."""
@@ -119,7 +174,10 @@ class ComparisonProcessor:
         sections: List[str]
     ) -> tuple[pd.DataFrame, List[Dict[str, Any]]]:
         """Process specifications from all sections."""
-        all_specs: List[Dict[str, Any]] = []
+        # Build the table column-wise so pandas constructs it in one pass
+        category_col: List[str] = []
+        spec_col: List[str] = []
+        model_cols: Dict[str, List[Optional[str]]] = {name: [] for name in model_numbers}
         spec_differences: List[Dict[str, Any]] = []
 
         for section in sections:
@@ -131,52 +189,54 @@ class ComparisonProcessor:
 
             # Create rows with values for all models
             for category, specification in ordered_specs:
-                row = {
-                    "Category": category,
-                    "Specification": specification
-                }
-
-                # Add values for each model
-                values = {}
-                for name in model_numbers:
+                category_col.append(category)
+                spec_col.append(specification)
+
+                # Add values for each model, noting whether any two differ
+                first_value: Optional[str] = None
+                differ = False
+                for name, column in model_cols.items():
+                    value: Optional[str] = None
                     if name in models and section in models[name].sections:
                         section_data = models[name].sections[section]
                         value = self._get_spec_value(section_data, category, specification)
-                        row[name] = value
                         if value:
-                            values[name] = value
-
-                all_specs.append(row)
-
-                # Check for differences
-                if len(set(values.values())) > 1:
+                            if first_value is None:
+                                first_value = value
+                            elif value != first_value:
+                                differ = True
+                    column.append(value)
+
+                # Only collect the values for rows that actually differ
+                if differ:
                     spec_differences.append({
                         "Category": category,
                         "Specification": specification,
-                        **values
+                        **{
+                            name: column[-1]
+                            for name, column in model_cols.items()
+                            if column[-1]
+                        }
                     })
 
-        # Add diagram paths as a row
-        diagram_row: Dict[str, str] = {
-            "Category": "Diagram",
-            "Specification": ""
+        # Add diagram paths as a row, only if any model has one
+        diagram_paths = {
+            name: models[name].diagram_path
+            for name in model_cols
+            if name in models and models[name].diagram_path
         }
-        has_diagrams = False
-        for name in model_numbers:
-            if name in models:
-                model_data = models[name]
-                if model_data.diagram_path is not None:
-                    diagram_row[name] = model_data.diagram_path
-                    has_diagrams = True
-                else:
-                    diagram_row[name] = ""
-            else:
-                diagram_row[name] = ""
-
-        if has_diagrams:
-            all_specs.append(diagram_row)
-
-        return pd.DataFrame(all_specs), spec_differences
+        if diagram_paths:
+            category_col.append("Diagram")
+            spec_col.append("")
+            for name, column in model_cols.items():
+                column.append(diagram_paths.get(name, ""))
+
+        specs_df = pd.DataFrame({
+            "Category": category_col,
+            "Specification": spec_col,
+            **model_cols
+        })
+        return specs_df, spec_differences
 
     def _get_ordered_specs(
         self,
@@ -242,7 +302,9 @@ class ComparisonProcessor:
         feature_type: str
     ) -> pd.DataFrame:
         """Process features or advantages from models."""
-        rows: List[Dict[str, Any]] = []
+        rows: Dict[str, Dict[str, Any]] = {}
+        # Every new row starts unchecked for all models
+        empty_template = {n: "" for n in model_numbers}
 
         # Process each model in order
         for name in model_numbers:
@@ -287,19 +349,16 @@ class ComparisonProcessor:
             if current_item:
                 processed_items.append(current_item)
 
-            # Create rows from processed items
+            # Create rows from processed items, keyed by item text
             for item in processed_items:
-                # Check if item already exists
-                existing = next((r for r in rows if r["Specification"] == item), None)
+                existing = rows.get(item)
                 if existing:
                     existing[name] = "✓"
                 else:
-                    row = {"Specification": item}
-                    row.update({n: "✓" if n == name else "" for n in model_numbers})
-                    rows.append(row)
+                    rows[item] = {"Specification": item, **empty_template, name: "✓"}
 
         # Create DataFrame and rename Specification column to empty string
-        df = pd.DataFrame(rows) if rows else pd.DataFrame()
+        df = pd.DataFrame(list(rows.values())) if rows else pd.DataFrame()
         if not df.empty:
             df.rename(columns={"Specification": ""}, inplace=True)
         return df
\ No newline at end of file
@@ -4,6 +4,24 @@ import pandas as pd
 from hsi_pdf_agent.models.differences import Differences, Difference
 
 
+def _split_specification(spec: str) -> Tuple[str, str, Optional[str]]:
+    """Split "Category - Subcategory (unit)" into its parts.
+
+    The unit is taken from the last "(" to the last ")", matching
+    Differences.from_dataframe.
+    """
+    unit = None
+    unit_start = spec.rfind("(")
+    unit_end = spec.rfind(")")
+    if unit_start > 0 and unit_end > unit_start:
+        unit = spec[unit_start + 1:unit_end].strip()
+        spec = spec[:unit_start].strip()
+
+    parts = spec.split(" - ", 1)
+    subcategory = parts[1] if len(parts) > 1 else ""
+    return parts[0], subcategory, unit
+
+
 class DifferenceProcessor:
     """Processor for analyzing differences between models."""
 
@@ -21,35 +39,32 @@ class DifferenceProcessor:
             if col not in ["Category", "Specification"]
         ]
 
-        # Process each row
-        for _, row in df.iterrows():
-            # Get model-specific values
+        # Normalize every model cell in one columnar pass instead of
+        # boxing each row through iterrows()
+        block = df[model_cols].astype(str).apply(lambda col: col.str.strip())
+        # Missing cells are taken from the frame before astype(str), which
+        # turns them into "nan" on pandas < 3 but keeps them NaN on pandas >= 3
+        present = (
+            df[model_cols].notna()
+            & (block != "")
+            & (block.apply(lambda col: col.str.lower()) != "nan")
+        )
+
+        # Only rows where at least two models have values can differ
+        candidates = (present.sum(axis=1) >= 2).to_numpy().nonzero()[0]
+        cells = block.to_numpy()
+        has_value = present.to_numpy()
+
+        specs = df["Specification"].astype(str).to_numpy()
+
+        for idx in candidates:
+            category, subcategory, unit = _split_specification(specs[idx])
             values = {
-                model: str(row[model]).strip()
-                for model in model_cols
-                if str(row[model]).strip() and
-                str(row[model]).lower() != 'nan'
+                model: cells[idx, col]
+                for col, model in enumerate(model_cols)
+                if has_value[idx, col]
             }
 
-            if len(values) < 2:  # Skip if not enough models have values
-                continue
-
-            # Split specification into parts
-            spec = row["Specification"]
-            unit = None
-            if "(" in spec and ")" in spec:
-                # Extract unit from parentheses
-                unit_start = spec.rfind("(")
-                unit_end = spec.rfind(")")
-                if unit_start > 0 and unit_end > unit_start:
-                    unit = spec[unit_start + 1:unit_end].strip()
-                    spec = spec[:unit_start].strip()
-
-            # Split category and subcategory
-            parts = spec.split(" - ", 1)
-            subcategory = parts[1] if len(parts) > 1 else ""
-            category = parts[0]
-
             # Add difference if values are actually different
             differences.add_difference(
                 category=category,
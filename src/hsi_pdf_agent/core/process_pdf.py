@@ -1,7 +1,14 @@
 """Service for processing PDF specifications."""
-from typing import Dict, List, Optional
+import asyncio
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
 import pdfplumber
+from pdfplumber.page import Page
 import fitz  # type: ignore  # PyMuPDF
 import re
 
@@ -10,6 +17,26 @@ from hsi_pdf_agent.models.pdf import (
 )
 from hsi_pdf_agent.core.config import get_settings
 
+# Model number such as "HSR-980R" -> "980R"
+_HSR_RE = re.compile(r'HSR-(\d+[RFW]?)', re.IGNORECASE)
+# Model number in a datasheet filename such as "HSR-980R-Series-Rev-A.pdf"
+_HSR_FILENAME_RE = re.compile(r'HSR-(\d+[RFW]?)-', re.IGNORECASE)
+# Runs of non-alphanumeric characters (underscore included)
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+# Bump whenever _parse_pdf's output changes so cached parses are redone
+_CACHE_VERSION = 1
+
+
+def _within_box(
+    bbox: tuple[float, float, float, float],
+    box: tuple[float, float, float, float]
+) -> bool:
+    """Check whether a bounding box lies entirely inside another."""
+    return (
+        bbox[0] >= box[0] and bbox[1] >= box[1] and
+        bbox[2] <= box[2] and bbox[3] <= box[3]
+    )
+
 
 class PDFProcessor:
     def __init__(self) -> None:
@@ -23,52 +50,56 @@ class PDFProcessor:
             )
         }
         self.section_order = ['electrical', 'magnetic', 'physical']
-        self.pdf_dir = Path(get_settings().PDF_DIR)
+        self._settings = get_settings()
+        self.pdf_dir = Path(self._settings.PDF_DIR)
+        # Output directories already created by this processor
+        self._diagram_dirs_ready: set[Path] = set()
 
-    def _extract_text(self, filename: str) -> str:
-        """Extract text from the first page of a PDF file."""
-        path = Path(filename)
-        self.current_file = path
-        with pdfplumber.open(path) as pdf:
-            first_page = pdf.pages[0]
-            return first_page.extract_text()
+    def _extract_text(self, page: fitz.Page) -> str:
+        """Extract text from the first page of a PDF file.
+
+        Uses PyMuPDF's text layer instead of pdfplumber's layout pass.
+        Whitespace runs are collapsed and blank lines dropped so table
+        rows read the same way pdfplumber joined them.
+        """
+        raw_text = page.get_text("text", sort=True)
+        lines = (' '.join(line.split()) for line in raw_text.split('\n'))
+        return '\n'.join(line for line in lines if line)
 
     def _parse_features_advantages(
         self,
-        text: str,
-        tables: List[List[List[str]]]
+        page: fitz.Page
     ) -> Optional[Dict[str, SectionData]]:
-        """Extract features and advantages using bounding boxes."""
-        if not self.current_file:
-            return None
+        """Extract features and advantages using bounding boxes.
 
-        features: List[str] = []
-        advantages: List[str] = []
-
-        with pdfplumber.open(self.current_file) as pdf:
-            page = pdf.pages[0]
-
-            # Extract features from left box
-            feat_box = (0, 130, 295, 210)
-            feat_area = page.within_bbox(feat_box)
-            feat_text = feat_area.extract_text()
-            if feat_text:
-                features = []
-                for line in feat_text.split('\n'):
-                    line = line.strip()
-                    if line and line.lower() != 'features':
-                        features.append(line)
-
-            # Extract advantages from right box
-            adv_box = (300, 130, 610, 210)
-            adv_area = page.within_bbox(adv_box)
-            adv_text = adv_area.extract_text()
-            if adv_text:
-                advantages = []
-                for line in adv_text.split('\n'):
-                    line = line.strip()
-                    if line and line.lower() != 'advantages':
-                        advantages.append(line)
+        Walks PyMuPDF's text dictionary once, keeping the spans that sit
+        entirely inside the features (left) or advantages (right) box.
+        """
+        feat_box = (0, 130, 295, 210)
+        adv_box = (300, 130, 610, 210)
+        feat_lines: List[tuple[float, float, str]] = []
+        adv_lines: List[tuple[float, float, str]] = []
+
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", ()):
+                for box, found in ((feat_box, feat_lines), (adv_box, adv_lines)):
+                    text = ''.join(
+                        span["text"] for span in line["spans"]
+                        if _within_box(span["bbox"], box)
+                    ).strip()
+                    if text:
+                        x0, top = line["bbox"][:2]
+                        found.append((top, x0, text))
+
+        # Read each box top to bottom, dropping its header line
+        features = [
+            text for _, _, text in sorted(feat_lines)
+            if text.lower() != 'features'
+        ]
+        advantages = [
+            text for _, _, text in sorted(adv_lines)
+            if text.lower() != 'advantages'
+        ]
 
         if features or advantages:
             return {
@@ -95,31 +126,27 @@ class PDFProcessor:
             }
         return None
 
-    def _extract_tables(self, text: str) -> List[List[List[str]]]:
+    def _extract_tables(self, page: Page) -> List[List[List[str]]]:
         """Extract tables from the first page of a PDF file."""
-        if not self.current_file:
-            return []
-        with pdfplumber.open(self.current_file) as pdf:
-            first_page = pdf.pages[0]
-            tables = first_page.extract_tables()
-            # Convert None values to empty strings
-            return [
-                [[str(cell) if cell else '' for cell in row] for row in table]
-                for table in tables
-            ]
+        tables = page.extract_tables()
+        # Normalize every cell once: None becomes '', text is stripped
+        return [
+            [[str(cell).strip() if cell else '' for cell in row] for row in table]
+            for table in tables
+        ]
 
     def _parse_table_to_specs(
         self,
         table: List[List[str]]
     ) -> Dict[str, Dict[str, SpecValue]]:
-        """Parse a table into specifications."""
+        """Parse a table into specifications.
+
+        Expects cells already normalized by ``_extract_tables``.
+        """
         if not table:  # Empty table
             return {}
 
-        # Clean first row
-        first_row = [
-            str(col).strip() if col else "" for col in table[0]
-        ]
+        first_row = table[0]
 
         # Skip features/advantages table
         if (len(first_row) == 2 and
@@ -140,13 +167,8 @@ class PDFProcessor:
         # Process rows
         rows_to_process = table if is_first_row_data else table[1:]
 
-        for row in rows_to_process:
+        for row_data in rows_to_process:
             try:
-                # Clean row data
-                row_data = [
-                    str(cell).strip() if cell else "" for cell in row
-                ]
-
                 if not any(row_data):  # Skip empty rows
                     continue
 
@@ -171,11 +193,11 @@ class PDFProcessor:
                     value = None
 
                     if len(row_data) > 3:
-                        unit = row_data[2].strip() if row_data[2] else ""
-                        value = row_data[3].strip() if row_data[3] else ""
+                        unit = row_data[2]
+                        value = row_data[3]
                     else:
                         unit = ""
-                        value = row_data[2].strip() if row_data[2] else ""
+                        value = row_data[2]
 
                     if value and category:
                         spec_value = SpecValue(unit=unit, value=value)
@@ -191,59 +213,54 @@ class PDFProcessor:
 
         return specs
 
+    def _find_section_headers(self, lines: List[str]) -> List[Tuple[int, str]]:
+        """Find the specification section headers and their line indexes."""
+        return [
+            (i, line) for i, line in enumerate(lines)
+            if "Specifications" in line
+        ]
+
     def _determine_section_type(
         self,
-        text: str,
+        section_headers: List[Tuple[int, str]],
         table_start_index: int
     ) -> str:
-        """Find the section name that precedes this table position."""
-        lines = text.split('\n')
-        lines = [line.strip() for line in lines]
-
-        # Find section headers and positions
-        section_positions = []
-        for i, line in enumerate(lines):
-            if "Specifications" in line:
-                section_positions.append((line.strip(), i))
+        """Find the section name that precedes this table position.
 
-        section_positions.sort(key=lambda x: x[1])
-
-        # Default to last section if can't determine
-        if not section_positions:
+        Args:
+            section_headers: Header line indexes and names, in line order
+            table_start_index: Line index where the table starts
+        """
+        if not section_headers:
             return ""
-        section_name = section_positions[-1][0]
-
-        # Find section header that precedes table
-        for i, (name, pos) in enumerate(section_positions):
-            next_pos = (
-                section_positions[i + 1][1]
-                if i + 1 < len(section_positions)
-                else len(lines)
-            )
 
-            if pos <= table_start_index < next_pos:
-                section_name = name
-                break
+        # Last header at or before the table; default to the last section
+        idx = bisect_right(
+            section_headers, table_start_index, key=lambda header: header[0]
+        ) - 1
+        return section_headers[idx][1] if idx >= 0 else section_headers[-1][1]
 
-        return section_name
-
-    def _extract_notes(self, text: str) -> List[str]:
-        """Extract notes from the text."""
+    def _extract_notes(self, lines: List[str]) -> List[str]:
+        """Extract notes from the stripped lines of the first page."""
         notes = []
-        collecting_notes = False
         current_note = ""
 
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
+        # Jump straight to the Notes header; nothing before it is a note
+        start = next(
+            (i for i, line in enumerate(lines) if 'Notes:' in line), None
+        )
+        if start is None:
+            return notes
 
-            # Start collecting notes when we see the Notes header
+        for line in lines[start:]:
+            # Don't include the header itself
             if 'Notes:' in line:
-                collecting_notes = True
-                # Don't include the header itself
                 line = line.replace('Notes:', '').strip()
+            # A following specification section ends the notes
+            elif "Specifications" in line:
+                break
 
-            if collecting_notes and line:
+            if line:
                 # Handle bullet points
                 if '•' in line:
                     if current_note:
@@ -260,40 +277,33 @@ class PDFProcessor:
 
         return notes
 
-    def _extract_model_name(self, filename: str) -> str:
+    def _extract_model_name(self, lines: List[str], filename: str) -> str:
         """Extract the model name from the PDF content.
 
         Args:
+            lines: Stripped lines of the PDF's first page
             filename: Name of the PDF file (used as fallback)
 
         Returns:
             str: Model name (e.g., '100R') or empty string if not found
         """
-        if not self.current_file:
-            return ""
-
         # First try to extract from PDF content
-        with pdfplumber.open(self.current_file) as pdf:
-            first_page = pdf.pages[0]
-            text = first_page.extract_text()
-
-            # Look for HSR- pattern in the text
-            lines = text.split('\n')
-            for line in lines:
-                if 'HSR-' in line.upper():
-                    # Extract HSR-XXXR/F/W pattern
-                    parts = line.split()
-                    for part in parts:
-                        if 'HSR-' in part.upper():
-                            # Extract just the model number (e.g., HSR-100R)
-                            match = re.search(r'HSR-(\d+[RFW]?)', part, re.IGNORECASE)
-                            if match:
-                                # Return just the number and optional suffix
-                                return match.group(1).upper()
+        # Look for HSR- pattern in the text
+        for line in lines:
+            if 'HSR-' in line.upper():
+                # Extract HSR-XXXR/F/W pattern
+                parts = line.split()
+                for part in parts:
+                    if 'HSR-' in part.upper():
+                        # Extract just the model number (e.g., HSR-100R)
+                        match = _HSR_RE.search(part)
+                        if match:
+                            # Return just the number and optional suffix
+                            return match.group(1).upper()
 
         # Fallback: Try to extract from filename
         if filename:
-            match = re.search(r'HSR-(\d+[RFW]?)', filename, re.IGNORECASE)
+            match = _HSR_RE.search(filename)
             if match:
                 return match.group(1).upper()
 
@@ -304,76 +314,81 @@ class PDFProcessor:
 
         Replaces non-alphanumeric chars with underscores.
         """
-        # Replace non-alphanumeric chars with underscore
-        formatted = ''.join(
-            '_' if not c.isalnum() else c
-            for c in name
-        )
-        # Remove duplicate underscores if any
-        while '__' in formatted:
-            formatted = formatted.replace('__', '_')
+        # Replace each run of non-alphanumeric chars with one underscore
+        formatted = _NON_ALNUM_RE.sub('_', name)
         # Remove leading/trailing underscores and convert to title case
         return formatted.strip('_').title()
 
-    def _extract_model_diagram(self, output_dir: Optional[Path] = None) -> Optional[str]:
+    def _extract_model_diagram(
+        self,
+        doc: fitz.Document,
+        model_name: str,
+        output_dir: Optional[Path] = None,
+        source_mtime_ns: Optional[int] = None
+    ) -> Optional[str]:
         """Extract the model diagram image from the PDF.
 
         Args:
+            doc: Open PyMuPDF document for the PDF being processed
+            model_name: Model name used for the image filename (e.g., '100R')
             output_dir: Directory to save the diagram image. If None, uses settings.DIAGRAMS_DIR
+            source_mtime_ns: Modification time of the PDF; a saved diagram
+                older than this is extracted again. If None, any saved diagram is reused
 
         Returns:
             Optional[str]: Path to the saved image if successful, None otherwise
         """
-        if not self.current_file:
-            return None
-
         # Get output directory from settings if not provided
         if output_dir is None:
-            settings = get_settings()
-            output_dir = settings.DIAGRAMS_DIR
-
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = self._settings.DIAGRAMS_DIR
+
+        # Ensure output directory exists (once per processor)
+        if output_dir not in self._diagram_dirs_ready:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._diagram_dirs_ready.add(output_dir)
+
+        # Reuse a diagram extracted on an earlier run from this revision of the PDF
+        if model_name:
+            existing = output_dir / f"{model_name}.png"
+            if existing.is_file():
+                existing_stat = existing.stat()
+                if existing_stat.st_size > 0 and (
+                    source_mtime_ns is None
+                    or existing_stat.st_mtime_ns >= source_mtime_ns
+                ):
+                    return str(existing)
 
         try:
-            doc = fitz.open(self.current_file)
             page = doc[0]  # First page
 
             # Get list of images on the page
-            image_list = page.get_images()
+            image_list = page.get_images(full=True)
 
             if image_list:
-                # Find the largest image (likely the diagram)
-                largest_image = None
+                # Find the largest image (likely the diagram) from the
+                # width/height in each entry, so only the winner is decoded
+                largest_xref = None
                 max_size = 0
 
-                for img_idx, img in enumerate(image_list):
-                    xref = img[0]
-                    base_image = doc.extract_image(xref)
-
-                    # Calculate image size
-                    size = base_image["width"] * base_image["height"]
+                for img in image_list:
+                    size = img[2] * img[3]
                     if size > max_size:
                         max_size = size
-                        largest_image = base_image
+                        largest_xref = img[0]
+
+                if largest_xref is not None and model_name:
+                    largest_image = doc.extract_image(largest_xref)
 
-                if largest_image:
-                    # Extract model name from PDF content
-                    model_name = self._extract_model_name(self.current_file.name)
-                    if model_name:
-                        # Create output filename with just the model name
-                        output_path = output_dir / f"{model_name}.png"
+                    # Create output filename with just the model name
+                    output_path = output_dir / f"{model_name}.png"
 
-                        # Save image
-                        with open(output_path, "wb") as f:
-                            f.write(largest_image["image"])
+                    # Save image
+                    with open(output_path, "wb") as f:
+                        f.write(largest_image["image"])
 
-                        return str(output_path)
+                    return str(output_path)
         except Exception as e:
             print(f"Error extracting image: {e}")
-        finally:
-            if 'doc' in locals():
-                doc.close()
 
         return None
 
@@ -387,9 +402,16 @@ class PDFProcessor:
             Optional[Path]: Path to PDF if found, None otherwise
         """
         model_pattern = model_number.upper()
-        for pdf_path in self.pdf_dir.glob("*.pdf"):
-            if model_pattern in pdf_path.name.upper():
-                return pdf_path
+        try:
+            entries = os.scandir(self.pdf_dir)
+        except FileNotFoundError:
+            return None
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith(".pdf") and not name.startswith(".")
+                        and model_pattern in name.upper() and entry.is_file()):
+                    return Path(entry.path)
         return None
 
     def process_pdf(self, model_input: str) -> PDFData:
@@ -414,47 +436,162 @@ class PDFProcessor:
                 raise ValueError(f"No PDF found for model {model_input}")
 
         self.current_file = pdf_path
-        text = self._extract_text(str(pdf_path))
-        tables = self._extract_tables(text)
+
+        # Reuse the last parse if the file is unchanged since then
+        stat = pdf_path.stat()
+        cache_path = self._cache_path(pdf_path)
+        cached = self._load_cached(cache_path, pdf_path, stat)
+        if cached is not None:
+            return cached
+
+        data = self._parse_pdf(pdf_path)
+        self._store_cached(cache_path, pdf_path, stat, data)
+        return data
+
+    async def aprocess_pdf(self, model_input: str) -> PDFData:
+        """Process a PDF in a worker thread without blocking the event loop.
+
+        Args:
+            model_input: Either a model number (e.g., "520") or a full path to PDF
+
+        Returns:
+            PDFData: Structured data extracted from PDF
+        """
+        return await asyncio.to_thread(self.process_pdf, model_input)
+
+    def _cache_path(self, pdf_path: Path) -> Path:
+        """Get the parse cache file for a PDF.
+
+        The name includes a hash of the resolved path so same-named PDFs in
+        different directories get separate entries.
+        """
+        path_hash = hashlib.sha1(str(pdf_path.resolve()).encode()).hexdigest()[:16]
+        return self._settings.CACHE_DIR / f"{pdf_path.stem}-{path_hash}.json"
+
+    def _load_cached(
+        self,
+        cache_path: Path,
+        pdf_path: Path,
+        stat: os.stat_result
+    ) -> Optional[PDFData]:
+        """Load a cached parse if it still matches the PDF on disk.
+
+        The entry must come from this cache version and match the PDF's
+        resolved path, mtime and size, and its diagram (if any) must still
+        exist.
+        """
+        try:
+            entry = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if (entry.get("version") != _CACHE_VERSION or
+                entry.get("path") != str(pdf_path.resolve()) or
+                entry.get("mtime_ns") != stat.st_mtime_ns or
+                entry.get("size") != stat.st_size):
+            return None
+
+        try:
+            data = PDFData.model_validate(entry["data"])
+        except (KeyError, ValueError):
+            return None
+
+        if data.diagram_path and not Path(data.diagram_path).exists():
+            return None
+        return data
+
+    def _store_cached(
+        self,
+        cache_path: Path,
+        pdf_path: Path,
+        stat: os.stat_result,
+        data: PDFData
+    ) -> None:
+        """Write a parse result to the cache, ignoring write failures.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partial entry.
+        """
+        entry = {
+            "version": _CACHE_VERSION,
+            "path": str(pdf_path.resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "data": data.model_dump(mode="json"),
+        }
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f".{cache_path.stem}-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            print(f"Error caching {pdf_path.name}: {e}")
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
+    def _parse_pdf(self, pdf_path: Path) -> PDFData:
+        """Extract structured data from a PDF file."""
+        # Text, features/advantages and the diagram come from one PyMuPDF
+        # document; pdfplumber is only needed for tables
+        with fitz.open(pdf_path) as doc:
+            first_page = doc[0]
+            text = self._extract_text(first_page)
+            # Split once; every line-based helper shares this list
+            lines = [line.strip() for line in text.split('\n')]
+            diagram_path = self._extract_model_diagram(
+                doc,
+                self._extract_model_name(lines, pdf_path.name),
+                source_mtime_ns=pdf_path.stat().st_mtime_ns
+            )
+            feat_adv_sections = self._parse_features_advantages(first_page)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            tables = self._extract_tables(pdf.pages[0])
 
         # Initialize sections
         sections: Dict[str, SectionData] = {}
 
         # Extract features and advantages
-        feat_adv_sections = self._parse_features_advantages(text, tables)
         if feat_adv_sections:
             sections.update(feat_adv_sections)
 
-        # Process specification tables
-        lines = text.split('\n')
-        table_positions = []
-        current_pos = 0
+        # Process specification tables in one forward scan over the page
+        # text, parsing each table as soon as its first row is located
+        section_headers = self._find_section_headers(lines)
+        search_from = 0  # Offset of the first line not yet searched
+        line_index = 0  # Line number at search_from
 
-        # Find table positions
         for table in tables:
             if not table or not table[0]:  # Skip empty tables
                 continue
 
-            cells = [str(cell) for cell in table[0] if cell]
+            cells = [cell for cell in table[0] if cell]
             first_row = ' '.join(cells)
 
-            # Find position of this table in text
-            while current_pos < len(lines):
-                if first_row in lines[current_pos]:
-                    table_positions.append(current_pos)
-                    current_pos += 1
-                    break
-                current_pos += 1
-
-        # Process tables with positions
-        table_pairs = zip(tables, table_positions)
-        for i, (table, pos) in enumerate(table_pairs):
+            # A signature spanning lines can never match a single line
+            found = -1 if '\n' in first_row else text.find(first_row, search_from)
+            if found == -1:
+                # Nothing left to match against, as with the old line scan
+                search_from = len(text) + 1
+                continue
+
+            line_index += text.count('\n', search_from, found)
+            pos = line_index
+
+            # Resume at the start of the following line
+            line_end = text.find('\n', found)
+            search_from = len(text) + 1 if line_end == -1 else line_end + 1
+            line_index += 1
+
             specs = self._parse_table_to_specs(table)
             if not specs:  # Skip if no specs found
                 continue
 
             # Get section type
-            section_name = self._determine_section_type(text, pos)
+            section_name = self._determine_section_type(section_headers, pos)
             if not section_name:
                 continue
 
@@ -468,14 +605,11 @@ class PDFProcessor:
                 sections[section_key] = SectionData(categories=cat_specs)
 
         # Extract notes
-        notes = self._extract_notes(text)
+        notes = self._extract_notes(lines)
         notes_dict = {str(i + 1): note for i, note in enumerate(notes)} if notes else None
 
-        # Extract diagram
-        diagram_path = self._extract_model_diagram()
-
         # Extract model name from filename
-        model_match = re.search(r'HSR-(\d+[RFW]?)-', pdf_path.name, re.IGNORECASE)
+        model_match = _HSR_FILENAME_RE.search(pdf_path.name)
         model_name = f"HSR-{model_match.group(1)}" if model_match else ""
 
         return PDFData(
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 from hsi_pdf_agent.models.prompt_config import PromptConfig, PromptConfigurations
@@ -37,7 +37,7 @@ class PromptManager:
             raise ValueError(f"Invalid prompt name: {prompt_name}")
         
         # Update prompt metadata
-        prompt_config.last_modified = datetime.utcnow()
+        prompt_config.last_modified = datetime.now(timezone.utc)
         prompt_config.modified_by = admin
         
         # Save updated prompt
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from jose import jwt
 from argon2 import PasswordHasher
 import logfire
@@ -41,9 +41,9 @@ def get_password_hash(password: str) -> str:
 def create_access_token(username: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(hours=8)
+        expire = datetime.now(timezone.utc) + timedelta(hours=8)
         
     to_encode = {"sub": username, "exp": expire}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM) 
\ No newline at end of file
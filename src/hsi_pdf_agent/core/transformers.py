@@ -73,7 +73,7 @@ class UnitStandardizer:
                 return cls.STANDARD_UNITS["°F"].display
 
         # Handle resistance units
-        if any(unit.lower().startswith(ohm) for ohm in ["ohm", "Ohm"]):
+        if unit.lower().startswith("ohm"):
             return cls.STANDARD_UNITS["ohm"].display
 
         # If no standardization needed, return as is
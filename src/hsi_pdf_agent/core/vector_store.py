@@ -1,7 +1,7 @@
 """Vector store for embeddings."""
 from typing import List, Tuple, Optional
 from uuid import uuid4, UUID
-from datetime import datetime
+from datetime import datetime, timezone
 import numpy as np
 from openai import OpenAI
 import logfire
@@ -11,14 +11,40 @@ import json
 from hsi_pdf_agent.models.vector import VectorEntry
 
 
+def _cosine_scores(dots: np.ndarray, norms: np.ndarray) -> np.ndarray:
+    """Divide dot products by norm products, scoring zero-norm vectors as 0."""
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
 class VectorStore:
     """Service for managing vector embeddings."""
 
     def __init__(self, openai_client: OpenAI):
         self.client = openai_client
         self.entries: List[VectorEntry] = []
+        # float32 (N, d) matrix of the entries' embeddings and its row norms,
+        # built once and reused until the entry list changes
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_norms: Optional[np.ndarray] = None
+        self._matrix_entries: Optional[List[VectorEntry]] = None
         self._load_entries()
 
+    def _embedding_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the stored embeddings as a float32 matrix and their norms.
+
+        The matrix is rebuilt only when entries are added or the entry list
+        is replaced, not on every search.
+        """
+        if (self._matrix is None or self._matrix_norms is None
+                or self._matrix_entries is not self.entries
+                or len(self._matrix) != len(self.entries)):
+            self._matrix = np.array(
+                [entry.embedding for entry in self.entries], dtype=np.float32
+            )
+            self._matrix_norms = np.linalg.norm(self._matrix, axis=1)
+            self._matrix_entries = self.entries
+        return self._matrix, self._matrix_norms
+
     def _load_entries(self) -> None:
         """Load entries from storage."""
         storage_path = os.getenv("VECTOR_STORE_PATH", "data/vector_store.json")
@@ -107,7 +133,7 @@ class VectorStore:
             content=content,
             embedding=embedding_list,
             model_name="text-embedding-3-small",
-            updated_at=datetime.utcnow(),
+            updated_at=datetime.now(timezone.utc),
             similarity_score=None,
             filename=filename,
             page_number=page_number
@@ -132,6 +158,15 @@ class VectorStore:
         embedding_data = response.data[0].embedding
         return np.array([float(x) for x in embedding_data], dtype=np.float64)
 
+    async def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Get embedding vectors for several texts in a single API call."""
+        response = self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=texts
+        )
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return np.array([item.embedding for item in ordered], dtype=np.float64)
+
     async def search(
         self,
         query: str,
@@ -141,16 +176,13 @@ class VectorStore:
         if not self.entries:
             return []
 
-        query_embedding = await self._get_embedding(query)
-
-        # Convert stored embeddings to numpy array
-        stored_embeddings = np.array([
-            entry.embedding for entry in self.entries
-        ])
+        query_embedding = (await self._get_embedding(query)).astype(np.float32)
+        stored_embeddings, stored_norms = self._embedding_matrix()
 
         # Calculate cosine similarities
-        similarities = np.dot(stored_embeddings, query_embedding) / (
-            np.linalg.norm(stored_embeddings, axis=1) * np.linalg.norm(query_embedding)
+        similarities = _cosine_scores(
+            stored_embeddings @ query_embedding,
+            stored_norms * np.linalg.norm(query_embedding)
         )
 
         # Get indices of top k similar entries
@@ -170,3 +202,40 @@ class VectorStore:
             top_k=top_k
         )
         return results
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 3
+    ) -> List[List[Tuple[float, VectorEntry]]]:
+        """Search for similar entries for several queries at once.
+
+        All queries are embedded in one API call and scored against the
+        stored embeddings with a single matrix product.
+        """
+        if not self.entries or not queries:
+            return [[] for _ in queries]
+
+        query_embeddings = (await self._get_embeddings(queries)).astype(np.float32)
+        stored_embeddings, stored_norms = self._embedding_matrix()
+
+        # Cosine similarity of every query against every entry
+        similarities = _cosine_scores(
+            query_embeddings @ stored_embeddings.T,
+            np.linalg.norm(query_embeddings, axis=1)[:, np.newaxis] * stored_norms
+        )
+
+        results = []
+        for query_similarities in similarities:
+            top_indices = np.argsort(query_similarities)[-top_k:][::-1]
+            results.append([
+                (float(query_similarities[i]), self.entries[i])
+                for i in top_indices
+            ])
+
+        logfire.info(
+            "vector_batch_search_complete",
+            num_queries=len(queries),
+            top_k=top_k
+        )
+        return results
@@ -9,7 +9,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from hsi_pdf_agent.core.ai_provider import close_ollama_provider
 from hsi_pdf_agent.core.config import settings
+from hsi_pdf_agent.core.process_compare import shutdown_pdf_pool
 from hsi_pdf_agent.routers.admin import router as admin_router
 from hsi_pdf_agent.routers.ai_query_analysis import router as analysis_router
 from hsi_pdf_agent.routers.pdf import router as pdf_router
@@ -32,6 +34,8 @@ async def lifespan(app: FastAPI) -> Any:
     yield
     # Shutdown
     print("Shutting down PDF RAG Chatbot")  # Using print instead of logfire
+    shutdown_pdf_pool()
+    await close_ollama_provider()
 
 # Create FastAPI app
 app = FastAPI(
@@ -2,10 +2,15 @@
 from typing import Dict, List, ClassVar, Any
 from pydantic import BaseModel, Field, ConfigDict
 import re
-from ..core.ai_provider import Message, OllamaProvider
+from ..core.ai_provider import Message, get_ollama_provider
 from ..core.chat_service import ChatService
 
 
+def _get_chat_service() -> ChatService:
+    """Get a chat service backed by the app's shared Ollama provider."""
+    return ChatService(provider=get_ollama_provider())
+
+
 class Recommendation(BaseModel):
     """Model for a single recommendation."""
     action: str = Field(..., description="The action verb (e.g., 'Choose', 'Select')")
@@ -87,7 +92,7 @@ Be technical but clear. Make each recommendation actionable and specific."""
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._chat_service = ChatService()
+        self._chat_service = _get_chat_service()
 
     @property
     def chat_service(self) -> ChatService:
@@ -116,14 +121,14 @@ Be technical but clear. Make each recommendation actionable and specific."""
     ) -> "AIFindings":
         """Analyze differences between models using AI."""
         # Format differences for analysis
-        diff_text = "Differences between models:\n\n"
+        parts = ["Differences between models:\n\n"]
         for spec, values in differences.items():
-            diff_text += f"{spec}:\n"
-            for model, value in values.items():
-                diff_text += f"  {model}: {value}\n"
-            diff_text += "\n"
+            parts.append(f"{spec}:\n")
+            parts.extend(f"  {model}: {value}\n" for model, value in values.items())
+            parts.append("\n")
+        diff_text = "".join(parts)
 
-        chat_service = ChatService(provider=OllamaProvider())
+        chat_service = _get_chat_service()
         messages = [
             Message(
                 role="system",
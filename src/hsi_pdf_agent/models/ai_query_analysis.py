@@ -2,7 +2,7 @@
 from typing import List, Optional, ClassVar, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
 import re
-from ..core.ai_provider import Message as AIMessage, OllamaProvider
+from ..core.ai_provider import Message as AIMessage, get_ollama_provider
 from ..core.chat_service import ChatService
 
 
@@ -122,7 +122,7 @@ Example response:
     @classmethod
     async def analyze_query(cls, query: str) -> "QueryAnalysis":
         """Analyze a user query to determine display settings."""
-        chat_service = ChatService(provider=OllamaProvider())
+        chat_service = ChatService(provider=get_ollama_provider())
         messages = [
             AIMessage(
                 role="system",
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
 from uuid import UUID
@@ -8,7 +8,7 @@ class BaseDocument(BaseModel):
     """Base model for all documents."""
     id: UUID = Field(..., description="Unique identifier")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp"
     )
     updated_at: Optional[datetime] = Field(
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List
 from pydantic import BaseModel, Field
 
@@ -10,7 +10,7 @@ class Message(BaseModel):
         description="Role of the message sender (system, user, assistant)"
     )
     content: str = Field(..., description="Content of the message")
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class Conversation(BaseModel):
@@ -188,6 +188,10 @@ class ComparisonResult(BaseModel):
     specs_df: pd.DataFrame
     spec_differences_df: pd.DataFrame
     findings: Optional[AIFindings] = None
+    model_names: List[str] = Field(
+        default_factory=list,
+        description="Full names of the compared models, in request order"
+    )
 
     def model_dump(self, **kwargs) -> Dict:
         """Convert DataFrames to serializable format."""
@@ -196,7 +200,8 @@ class ComparisonResult(BaseModel):
             "advantages_df": self._convert_df(self.advantages_df),
             "specs_df": self._convert_df(self.specs_df),
             "spec_differences_df": self._convert_df(self.spec_differences_df),
-            "findings": self.findings.model_dump() if self.findings else None
+            "findings": self.findings.model_dump() if self.findings else None,
+            "model_names": self.model_names
         }
 
     @staticmethod
@@ -43,13 +43,12 @@ class Differences(BaseModel):
 
         # Process each row
         for _, row in df.iterrows():
-            # Get model-specific values
-            values = {
-                model: str(row[model]).strip()
-                for model in model_cols
-                if (str(row[model]).strip() and
-                    str(row[model]).lower() != 'nan')
-            }
+            # Get model-specific values, converting each cell only once
+            values = {}
+            for model in model_cols:
+                value = str(row[model]).strip()
+                if value and value.lower() != 'nan':
+                    values[model] = value
 
             if len(values) < 2:  # Skip if not enough models have values
                 continue
@@ -1,20 +1,35 @@
-from datetime import datetime
-from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import Annotated, List, Dict, Any
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer, WithJsonSchema
 from uuid import UUID
 
 
+def _to_float32(value: Any) -> np.ndarray:
+    """Coerce a sequence of numbers to a contiguous float32 array."""
+    return np.ascontiguousarray(value, dtype=np.float32)
+
+
+# Stored as float32 for vectorized math, serialized as a plain list of floats
+FloatVector = Annotated[
+    np.ndarray,
+    BeforeValidator(_to_float32),
+    PlainSerializer(lambda v: v.tolist(), return_type=List[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 class Embedding(BaseModel):
     """Model for stored embeddings."""
     id: UUID = Field(..., description="Unique identifier for the embedding")
     content: str = Field(..., description="Original text content")
-    vector: List[float] = Field(..., description="Embedding vector")
+    vector: FloatVector = Field(..., description="Embedding vector")
     model: str = Field(..., description="Model used to generate the embedding")
     pdf_id: UUID = Field(..., description="ID of the PDF this embedding is from")
     page_number: int = Field(..., description="Page number in the PDF")
     section_number: int = Field(..., description="Section number in the page")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="When the embedding was created"
     )
     metadata: Dict[str, Any] = Field(
@@ -24,3 +39,4 @@ class Embedding(BaseModel):
 
     class Config:
         from_attributes = True
+        arbitrary_types_allowed = True
@@ -65,12 +65,18 @@ class ModelFeatureAdvantages(BaseModel):
         features = []
         advantages = []
 
+        # Normalize the columns once, then look rows up by model
+        categories = df["Category"].str.lower().tolist()
+        values = (
+            df["Value"].str.replace("\n", " ", regex=False).str.strip().tolist()
+        )
+        rows_by_model = df.groupby("Model", sort=False).indices
+
         for model in models:
-            model_data = df[df["Model"] == model]
-            for _, row in model_data.iterrows():
+            for i in rows_by_model.get(model, ()):
                 fa = FeatureAdvantage(
-                    category=row["Category"].lower(),
-                    value=row["Value"].replace("\n", " ").strip(),
+                    category=categories[i],
+                    value=values[i],
                     model=model
                 )
                 if fa.category == "features":
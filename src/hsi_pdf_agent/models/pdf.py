@@ -1,4 +1,6 @@
 """PDF data models."""
+import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any
 from pydantic import BaseModel, model_validator, ConfigDict, computed_field
 from pathlib import Path
@@ -7,6 +9,27 @@ import re
 from hsi_pdf_agent.core.transformers import TransformedSpecValue, SpecTransformer
 from hsi_pdf_agent.core.config import get_settings
 
+# Model number in a datasheet filename (e.g., "980R" in "HSR-980R-Series.pdf")
+_HSR_FILENAME_RE = re.compile(r'HSR-(\d+[RFW]?)-', re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _pdf_models(pdf_dir: Path, mtime_ns: int) -> tuple[tuple[Path, str], ...]:
+    """List the model PDFs in a directory with their model numbers.
+
+    Cached per directory modification time, so adding or removing a PDF
+    gives a fresh listing.
+    """
+    models = []
+    with os.scandir(pdf_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pdf") or entry.name.startswith("."):
+                continue
+            match = _HSR_FILENAME_RE.search(entry.name)
+            if match and entry.is_file():
+                models.append((Path(entry.path), match.group(1)))
+    return tuple(models)
+
 
 class SpecValue(BaseModel):
     """Represents a specification value with optional unit."""
@@ -108,16 +131,9 @@ class PDFLocator(BaseModel):
             .replace('HSR', '')
         )
 
-        for pdf_path in pdf_dir.glob("*.pdf"):
-            match = re.search(
-                r'HSR-(\d+[RFW]?)-',
-                pdf_path.name,
-                re.IGNORECASE
-            )
-            if match:
-                model_number = match.group(1)
-                if (clean_keyword in model_number or
-                        model_number in clean_keyword):
-                    full_model = f"HSR-{model_number}"
-                    return pdf_path, full_model
+        for pdf_path, model_number in _pdf_models(pdf_dir, pdf_dir.stat().st_mtime_ns):
+            if (clean_keyword in model_number or
+                    model_number in clean_keyword):
+                full_model = f"HSR-{model_number}"
+                return pdf_path, full_model
         return None
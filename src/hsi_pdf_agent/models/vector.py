@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -23,5 +23,9 @@ class VectorEntry(BaseModel):
         default_factory=dict,
         description="Additional metadata"
     )
+    similarity_score: Optional[float] = Field(
+        default=None,
+        description="Cosine similarity to the last search query"
+    )
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 import logging
 from typing import List
 from pydantic import BaseModel
@@ -6,7 +7,7 @@ from pydantic import BaseModel
 from hsi_pdf_agent.core.chat_service import ChatService
 from hsi_pdf_agent.schemas.chat import ChatQuery, ChatResponse
 from hsi_pdf_agent.core.process_compare import ComparisonProcessor
-from hsi_pdf_agent.core.ai_provider import OllamaProvider
+from hsi_pdf_agent.core.ai_provider import get_ollama_provider
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,7 @@ class ComparisonRequest(BaseModel):
 
 async def get_chat_service() -> ChatService:
     """Dependency to get chat service instance."""
-    provider = OllamaProvider()
-    return ChatService(provider=provider)
+    return ChatService(provider=get_ollama_provider())
 
 @chat_router.post("/query", response_model=ChatResponse)
 async def query(
@@ -42,6 +42,17 @@ async def query(
             detail="Error processing your question dawg!"
         )
 
+@chat_router.post("/query/stream")
+async def query_stream(
+    query: ChatQuery,
+    chat_service: ChatService = Depends(get_chat_service)
+) -> StreamingResponse:
+    """Query the PDFs, streaming the answer as it is generated."""
+    return StreamingResponse(
+        chat_service.generate_response_stream(question=query.question),
+        media_type="text/plain"
+    )
+
 @compare_router.post("/compare")
 async def compare_models(request: ComparisonRequest) -> dict:
     """Compare specifications between models."""
@@ -72,25 +83,25 @@ async def compare_models(request: ComparisonRequest) -> dict:
         
         # Transform specs_df to frontend format
         specs_data = {
-            "columns": ["Category", "Specification"] + request.model_numbers,
+            "columns": ["Category", "Specification"] + result.model_names,
             "data": result.specs_df.to_dict('records')
         }
         
         # Transform features and advantages
         features_data = {
-            "columns": ["Category", "Specification"] + request.model_numbers,
+            "columns": ["Category", "Specification"] + result.model_names,
             "data": result.features_df.to_dict('records') if not result.features_df.empty else []
         }
         
         advantages_data = {
-            "columns": ["Category", "Specification"] + request.model_numbers,
+            "columns": ["Category", "Specification"] + result.model_names,
             "data": result.advantages_df.to_dict('records') if not result.advantages_df.empty else []
         }
         
         return {
             "specifications": specs_data,
             "differences": {
-                "columns": ["Category", "Specification"] + request.model_numbers,
+                "columns": ["Category", "Specification"] + result.model_names,
                 "data": result.spec_differences_df.to_dict('records') if not result.spec_differences_df.empty else []
             },
             "features": features_data,
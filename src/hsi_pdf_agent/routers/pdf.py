@@ -1,7 +1,8 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from fastapi.responses import FileResponse
-from typing import List, Dict, Any, cast
+from typing import List, Dict, Any
 from pydantic import BaseModel
+import asyncio
 import logging
 from openai import OpenAI
 from pathlib import Path
@@ -28,10 +29,8 @@ def get_pdf_processor() -> PDFProcessor:
     """Dependency to get PDF processor instance."""
     settings = get_settings()
     processor = PDFProcessor()
-    pdf_dir = cast(Path, settings.PDF_DIR)
-    if not pdf_dir.exists():
-        pdf_dir.mkdir(parents=True, exist_ok=True)
-    processor.current_file = pdf_dir
+    # Settings creates PDF_DIR once at startup
+    processor.current_file = settings.PDF_DIR
     return processor
 
 
@@ -67,7 +66,7 @@ async def upload_pdf(
             pdf_file.write(content)
 
         # Process the PDF
-        document = pdf_processor.process_pdf(str(file_path))
+        document = await pdf_processor.aprocess_pdf(str(file_path))
 
         # Add sections to vector store
         for section_name, section_data in document.sections.items():
@@ -101,15 +100,20 @@ async def list_pdfs(
         if not pdf_processor.current_file or not isinstance(pdf_processor.current_file, Path):
             raise HTTPException(status_code=500, detail="PDF directory not configured")
 
-        pdfs = []
-        for file_path in pdf_processor.current_file.glob("*.pdf"):
-            document = pdf_processor.process_pdf(str(file_path))
-            pdfs.append(PDFResponse(
+        # Parse all PDFs concurrently in worker threads
+        file_paths = list(pdf_processor.current_file.glob("*.pdf"))
+        documents = await asyncio.gather(*(
+            pdf_processor.aprocess_pdf(str(file_path))
+            for file_path in file_paths
+        ))
+        return [
+            PDFResponse(
                 filename=file_path.name,
                 page_count=len(document.sections),
                 metadata={"sections": [str(s) for s in document.sections.keys()]}
-            ))
-        return pdfs
+            )
+            for file_path, document in zip(file_paths, documents)
+        ]
 
     except Exception as e:
         logger.error(f"Error listing PDFs: {str(e)}")
@@ -3,6 +3,7 @@ from pdfplumber.pdf import PDFStructTree
 import pandas as pd
 import pprint
 import re
+import sys
 
 #mypdf = "../uploads/pdfs/5ace7475-1f69-4918-b22f-1449703155ba_HSR-302R-Series-Rev-G.pdf"
 #mypdf = "../uploads/pdfs/b7947df6-147b-4bae-92f8-bfa9bf6c5b09_HSR-520R-Series-Rev-K.pdf"
@@ -11,30 +12,26 @@ mypdf = "uploads/pdfs/87240fbe-6e79-4f66-a4ab-1b97875d4ea3_HSR-190R-Series-Rev-H
 
 
 
-def extract_features():
-    with pdfplumber.open(mypdf) as pdf:
+def extract_features_and_advantages(pdf_path=mypdf):
+    # Open the PDF once and crop both boxes from the same first page
+    with pdfplumber.open(pdf_path) as pdf:
         p0 = pdf.pages[0]
         feat_bounding_box = (0, 150, 295, 210)
-        feat_crop_area = p0.within_bbox(feat_bounding_box)
-        feat_crop_text = feat_crop_area.extract_text().split('\n')
-        for text in feat_crop_text:
-            print(text)
-    return ''
-
-
-def extract_advantages():
-    with pdfplumber.open(mypdf) as pdf:
-        p0 = pdf.pages[0]
         adv_bounding_box = (300, 150, 610, 210)
-        adv_crop_area = p0.within_bbox(adv_bounding_box)
-        adv_crop_text = adv_crop_area.extract_text().split('\n')
-        for text in adv_crop_text:
-            print(text)
-    return ''
+        feat_crop_text = p0.within_bbox(feat_bounding_box).extract_text().split('\n')
+        adv_crop_text = p0.within_bbox(adv_bounding_box).extract_text().split('\n')
+    return feat_crop_text, adv_crop_text
 
 
 
 if __name__ == '__main__':
     #print(extract_text_bbox_keep_chars())
-    print(extract_features())
-    print(extract_advantages())
+    features, advantages = extract_features_and_advantages(
+        sys.argv[1] if len(sys.argv) > 1 else mypdf
+    )
+    for text in features:
+        print(text)
+    print('')
+    for text in advantages:
+        print(text)
+    print('')
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import os
 from pathlib import Path
 import httpx
 import asyncio
@@ -6,34 +7,62 @@ from typing import List
 
 from hsi_pdf_agent.core.config import get_settings
 
+# Uploads in flight at once
+MAX_CONCURRENT_UPLOADS = 8
+
+
+async def upload_pdf(
+    client: httpx.AsyncClient,
+    pdf_path: Path,
+    semaphore: asyncio.Semaphore
+) -> None:
+    """Upload a single PDF, waiting for a free upload slot first."""
+    async with semaphore:
+        print(f"Processing {pdf_path.name}...")
+
+        # Create form data with the PDF file; httpx reads the open handle
+        # in chunks as it sends the multipart body
+        with pdf_path.open('rb') as file:
+            form_data = {'file': (pdf_path.name, file, 'application/pdf')}
+            try:
+                response = await client.post(
+                    "http://localhost:8000/pdf/upload",
+                    files=form_data
+                )
+                if response.status_code == 200:
+                    print(f"✓ Successfully processed {pdf_path.name}")
+                else:
+                    print(f"✗ Error processing {pdf_path.name}: {response.text}")
+            except Exception as e:
+                print(f"✗ Error processing {pdf_path.name}: {str(e)}")
+
 
 async def process_pdfs() -> None:
     """Process all PDFs in the data/pdfs directory."""
     settings = get_settings()
-    pdf_files: List[Path] = list(settings.PDF_DIR.glob("*.pdf"))
+    # One directory read; scandir's entries already know their type
+    with os.scandir(settings.PDF_DIR) as entries:
+        pdf_files: List[Path] = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".pdf")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
 
     if not pdf_files:
         print("No PDF files found in directory.")
         return
 
-    async with httpx.AsyncClient() as client:
-        for pdf_path in pdf_files:
-            print(f"Processing {pdf_path.name}...")
-
-            # Create form data with the PDF file
-            with pdf_path.open('rb') as file:
-                form_data = {'file': file}
-                try:
-                    response = await client.post(
-                        "http://localhost:8000/pdf/upload",
-                        files=form_data
-                    )
-                    if response.status_code == 200:
-                        print(f"✓ Successfully processed {pdf_path.name}")
-                    else:
-                        print(f"✗ Error processing {pdf_path.name}: {response.text}")
-                except Exception as e:
-                    print(f"✗ Error processing {pdf_path.name}: {str(e)}")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_UPLOADS,
+        max_keepalive_connections=MAX_CONCURRENT_UPLOADS
+    )
+    async with httpx.AsyncClient(limits=limits) as client:
+        await asyncio.gather(*(
+            upload_pdf(client, pdf_path, semaphore)
+            for pdf_path in pdf_files
+        ))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Script to test PDF processing."""
-import json
 from hsi_pdf_agent.core.process_pdf import PDFProcessor
 
 
@@ -14,9 +13,8 @@ def main() -> None:
 
     try:
         result = processor.process_pdf(model)
-        # Convert to dict for pretty printing
-        result_dict = result.model_dump()
-        print(json.dumps(result_dict, indent=2))
+        # Serialize straight to JSON for pretty printing
+        print(result.model_dump_json(indent=2))
     except Exception as e:
         print(f"Error processing PDF: {e}")
 
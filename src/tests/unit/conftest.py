@@ -1,14 +1,32 @@
 """Test configuration and fixtures."""
 import pytest
+from pathlib import Path
+from typing import Iterator
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from openai import OpenAI
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from hsi_pdf_agent.core.ai_provider import AIProvider
 from hsi_pdf_agent.core.vector_store import VectorStore
 from hsi_pdf_agent.core.chat_service import ChatService
 from hsi_pdf_agent.models import Message, Conversation, VectorEntry
 from hsi_pdf_agent.core.process_pdf import PDFProcessor
-from hsi_pdf_agent.models.pdf import PDFData
+from hsi_pdf_agent.models.pdf import PDFData, SectionData, CategorySpec, SpecValue
+
+@pytest.fixture(scope="session")
+def vector_store_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture for a vector store file shared by the whole test session."""
+    return tmp_path_factory.mktemp("vector_store") / "vector_store.json"
+
+@pytest.fixture(autouse=True)
+def _isolated_vector_store(
+    vector_store_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Point the vector store at the session file and reset it after each test."""
+    monkeypatch.setenv("VECTOR_STORE_PATH", str(vector_store_path))
+    yield
+    vector_store_path.unlink(missing_ok=True)
 
 @pytest.fixture
 def openai_client() -> OpenAI:
@@ -21,9 +39,9 @@ def vector_store(openai_client: OpenAI) -> VectorStore:
     return VectorStore(openai_client)
 
 @pytest.fixture
-def chat_service(vector_store: VectorStore, openai_client: OpenAI) -> ChatService:
+def chat_service(vector_store: VectorStore) -> ChatService:
     """Fixture for ChatService instance."""
-    return ChatService(vector_store, openai_client)
+    return ChatService(provider=Mock(spec=AIProvider), vector_store=vector_store)
 
 @pytest.fixture
 def sample_message() -> Message:
@@ -32,7 +50,7 @@ def sample_message() -> Message:
         id=uuid4(),
         role="user",
         content="Test message",
-        updated_at=datetime.utcnow()
+        updated_at=datetime.now(timezone.utc)
     )
 
 @pytest.fixture
@@ -42,7 +60,7 @@ def sample_conversation(sample_message: Message) -> Conversation:
         id=uuid4(),
         title="Test Conversation",
         messages=[sample_message],
-        updated_at=datetime.utcnow()
+        updated_at=datetime.now(timezone.utc)
     )
 
 @pytest.fixture
@@ -53,6 +71,34 @@ def sample_vector_entry() -> VectorEntry:
         content="Test content",
         embedding=[0.1] * 1536,  # Typical embedding size
         model_name="text-embedding-3-small",
-        updated_at=datetime.utcnow(),
+        updated_at=datetime.now(timezone.utc),
         similarity_score=None
     )
+
+@pytest.fixture(scope="session")
+def sample_pdf_data() -> PDFData:
+    """Fixture for parsed PDF data, built once instead of parsing a real PDF."""
+    return PDFData(
+        model_name="HSR-980R",
+        sections={
+            "Features_And_Advantages": SectionData(categories={
+                "Features": CategorySpec(subcategories={
+                    "": SpecValue(value="• Low power\n• Hermetically sealed")
+                }),
+                "Advantages": CategorySpec(subcategories={
+                    "": SpecValue(value="• Long life")
+                })
+            }),
+            "Electrical Specifications": SectionData(categories={
+                "Contact Rating": CategorySpec(subcategories={
+                    "Switching Voltage": SpecValue(value=200, unit="V")
+                })
+            })
+        }
+    )
+
+@pytest.fixture
+def pdf_processor(sample_pdf_data: PDFData) -> Iterator[PDFProcessor]:
+    """Fixture for a PDFProcessor whose process_pdf returns sample_pdf_data."""
+    with patch.object(PDFProcessor, "process_pdf", return_value=sample_pdf_data):
+        yield PDFProcessor()
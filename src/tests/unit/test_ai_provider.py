@@ -0,0 +1,51 @@
+"""Tests for the AI provider."""
+import json
+import httpx
+import pytest
+from hsi_pdf_agent.core.ai_provider import Message, OllamaProvider
+
+@pytest.mark.asyncio
+async def test_ollama_stream_skips_think_block() -> None:
+    """Test that the NDJSON stream yields content in order without thinking."""
+    lines = [
+        json.dumps({"message": {"content": "<think>"}}),
+        json.dumps({"message": {"content": "Compare the ratings"}}),
+        json.dumps({"message": {"content": "</think>"}}),
+        json.dumps({"message": {"content": "The HSR-520R"}}),
+        "",
+        "not json",
+        json.dumps({"message": {"content": " is sealed."}}),
+        json.dumps({"message": {"content": ""}, "done": True}),
+        json.dumps({"message": {"content": "after done"}}),
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+    provider = OllamaProvider(base_url="http://ollama.test")
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    chunks = [
+        chunk async for chunk in provider.stream(
+            [Message(role="user", content="Which model is sealed?")]
+        )
+    ]
+
+    assert chunks == ["The HSR-520R", " is sealed."]
+    assert requests[0].url == "http://ollama.test/api/chat"
+    assert json.loads(requests[0].content)["stream"] is True
+
+@pytest.mark.asyncio
+async def test_ollama_aclose_releases_client() -> None:
+    """Test that aclose closes the pooled client and a later call opens a new one."""
+    provider = OllamaProvider()
+    client = provider._get_client()
+
+    await provider.aclose()
+
+    assert client.is_closed
+    assert provider._client is None
+    assert provider._get_client() is not client
+    await provider.aclose()
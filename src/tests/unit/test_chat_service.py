@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timezone
+from typing import AsyncIterator, List
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from hsi_pdf_agent.core.ai_provider import AIProvider, ChatResponse
+from hsi_pdf_agent.core.ai_provider import Message as AIMessage
+from hsi_pdf_agent.core.chat_service import ChatService
+from hsi_pdf_agent.core.vector_store import VectorStore
+from hsi_pdf_agent.models import Conversation, Message, VectorEntry
+from hsi_pdf_agent.routers.chat import chat_router, get_chat_service
+
+
+class ChunkProvider(AIProvider):
+    """Provider that streams a fixed list of chunks."""
+
+    def __init__(self, chunks: List[str]) -> None:
+        """Initialize the provider with the chunks to stream."""
+        self.chunks = chunks
+
+    async def complete(self, messages: List[AIMessage], **kwargs) -> ChatResponse:
+        """Return all chunks joined as one answer."""
+        return ChatResponse(content="".join(self.chunks))
+
+    async def stream(self, messages: List[AIMessage], **kwargs) -> AsyncIterator[str]:
+        """Yield the chunks in order."""
+        for chunk in self.chunks:
+            yield chunk
+
+@pytest.mark.asyncio
+async def test_create_conversation(chat_service: ChatService) -> None:
+    """Test creating a new conversation."""
+    conversation = await chat_service.create_conversation("Test Chat")
+
+    assert conversation.title == "Test Chat"
+    assert isinstance(conversation.id, UUID)
+    assert isinstance(conversation.created_at, datetime)
+    assert isinstance(conversation.updated_at, datetime)
+    assert len(conversation.messages) == 0
+
+@pytest.mark.asyncio
+async def test_add_message(
+    chat_service: ChatService,
+    sample_conversation: Conversation
+) -> None:
+    """Test adding a message to a conversation."""
+    message = await chat_service.add_message(
+        conversation=sample_conversation,
+        role="user",
+        content="Hello!"
+    )
+
+    assert message.role == "user"
+    assert message.content == "Hello!"
+    assert isinstance(message.id, UUID)
+    assert isinstance(message.created_at, datetime)
+    assert isinstance(message.updated_at, datetime)
+    assert len(sample_conversation.messages) == 2  # Including the sample message
+
+@pytest.mark.asyncio
+async def test_generate_response_stream() -> None:
+    """Test that chunks are yielded in order and the answer is recorded."""
+    chat_service = ChatService(provider=ChunkProvider(["The ", "HSR-520R ", "is sealed."]))
+    conversation = Conversation(
+        id=str(uuid4()),
+        title="Stream",
+        updated_at=datetime.now(timezone.utc)
+    )
+
+    chunks = [
+        chunk async for chunk in chat_service.generate_response_stream(
+            "Which model is sealed?",
+            conversation=conversation
+        )
+    ]
+
+    assert chunks == ["The ", "HSR-520R ", "is sealed."]
+    assert conversation.messages[-1].role == "assistant"
+    assert conversation.messages[-1].content == "The HSR-520R is sealed."
+
+def test_query_stream_route() -> None:
+    """Test that /chat/query/stream streams the provider's chunks in order."""
+    app = FastAPI()
+    app.include_router(chat_router)
+    app.dependency_overrides[get_chat_service] = lambda: ChatService(
+        provider=ChunkProvider(["First", " second", " third"])
+    )
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/chat/query/stream",
+            json={"question": "Stream please"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == "First second third"
+
+@pytest.mark.asyncio
+async def test_get_relevant_context_batch() -> None:
+    """Test that each question gets the content of its own matches, in rank order."""
+    entries = [
+        VectorEntry(id=uuid4(), content=content, embedding=[0.1, 0.2])
+        for content in ("Contact rating 10 W", "Coil voltage 5 V", "Glass capsule")
+    ]
+    vector_store = Mock(spec=VectorStore)
+    vector_store.search_batch = AsyncMock(return_value=[
+        [(0.9, entries[0]), (0.4, entries[2])],
+        [(0.8, entries[1])],
+    ])
+    chat_service = ChatService(provider=ChunkProvider([]), vector_store=vector_store)
+
+    contexts = await chat_service.get_relevant_context_batch(
+        ["Which rating?", "Which voltage?"],
+        top_k=2
+    )
+
+    assert contexts == [
+        ["Contact rating 10 W", "Glass capsule"],
+        ["Coil voltage 5 V"],
+    ]
+    vector_store.search_batch.assert_awaited_once_with(
+        ["Which rating?", "Which voltage?"],
+        top_k=2
+    )
+
+@pytest.mark.asyncio
+async def test_get_relevant_context_batch_requires_vector_store() -> None:
+    """Test that batch context lookup fails clearly without a vector store."""
+    chat_service = ChatService(provider=ChunkProvider([]))
+
+    with pytest.raises(ValueError):
+        await chat_service.get_relevant_context_batch(["Which rating?"])
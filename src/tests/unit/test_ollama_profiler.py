@@ -0,0 +1,50 @@
+import pytest
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock
+from ollama_profiler import ollama_profiler
+from ollama_profiler.ollama_profiler import OllamaProfiler
+
+@pytest.fixture
+def profiler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[OllamaProfiler]:
+    """Fixture for a profiler with its database under a temporary home."""
+    monkeypatch.setattr(ollama_profiler.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(ollama_profiler.socket, "gethostbyname", lambda host: "127.0.0.1")
+    profiler = OllamaProfiler()
+    yield profiler
+    profiler.close()
+
+def test_run_sweep_round_robin(profiler: OllamaProfiler) -> None:
+    """Test that configs are dealt round-robin and results keep config order."""
+    base_urls = ["http://gpu-a:11434", "http://gpu-b:11434"]
+    configs = [(layers, 512, 8) for layers in range(5)]
+    profiler.run_test = Mock(
+        side_effect=lambda *config, base_url, flush: (config, base_url)
+    )
+
+    results = profiler.run_sweep(configs, base_urls=base_urls)
+
+    assert results == [
+        (config, base_urls[i % len(base_urls)])
+        for i, config in enumerate(configs)
+    ]
+    assert profiler.run_test.call_count == len(configs)
+    assert all(not call.kwargs["flush"] for call in profiler.run_test.call_args_list)
+
+def test_run_sweep_requires_server(profiler: OllamaProfiler) -> None:
+    """Test that a sweep without servers is rejected."""
+    profiler.run_test = Mock()
+
+    with pytest.raises(ValueError):
+        profiler.run_sweep([(35, 1024, 8)], base_urls=[])
+
+    profiler.run_test.assert_not_called()
+
+def test_live_feed_opened_on_first_save(profiler: OllamaProfiler) -> None:
+    """Test that the live feed file is only created once a run is saved."""
+    assert not profiler.live_path.exists()
+
+    run = dict.fromkeys(ollama_profiler.RUN_COLUMNS, 1)
+    profiler.save_runs([run])
+
+    assert profiler.live_path.read_text().count("\n") == 1
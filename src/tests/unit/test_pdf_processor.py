@@ -1,8 +1,66 @@
 """Tests for PDF processor."""
 import pytest
 from unittest.mock import Mock, patch
+from hsi_pdf_agent.core import process_pdf
 from hsi_pdf_agent.core.process_pdf import PDFProcessor
+from hsi_pdf_agent.core.process_compare import ComparisonProcessor
 from hsi_pdf_agent.models.pdf import PDFData
 from hsi_pdf_agent.core.config import get_settings
 from typing import List, cast
-from pathlib import Path 
\ No newline at end of file
+from pathlib import Path
+
+@pytest.mark.asyncio
+async def test_aprocess_pdf(
+    pdf_processor: PDFProcessor,
+    sample_pdf_data: PDFData
+) -> None:
+    """Test that the async wrapper returns the parsed data."""
+    result = await pdf_processor.aprocess_pdf("980R")
+
+    assert result is sample_pdf_data
+    cast(Mock, pdf_processor.process_pdf).assert_called_once_with("980R")
+
+def test_convert_to_model_specs(sample_pdf_data: PDFData) -> None:
+    """Test splitting features and advantages out of parsed data."""
+    specs = ComparisonProcessor()._convert_to_model_specs("980R", sample_pdf_data)
+
+    assert specs.model_name == "980R"
+    assert specs.features_advantages == {
+        "features": ["• Low power", "• Hermetically sealed"],
+        "advantages": ["• Long life"]
+    }
+    assert list(specs.sections) == ["Electrical Specifications"]
+
+def test_parse_cache_keyed_by_path_and_version(
+    tmp_path: Path,
+    sample_pdf_data: PDFData,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that same-named PDFs get separate cache entries and old versions are reparsed."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    pdf_paths = []
+    for folder in ("a", "b"):
+        pdf_path = tmp_path / folder / "HSR-980R-Series.pdf"
+        pdf_path.parent.mkdir()
+        pdf_path.write_bytes(f"%PDF {folder}".encode())
+        pdf_paths.append(pdf_path)
+    parsed = {
+        path: sample_pdf_data.model_copy(update={"model_name": f"HSR-980R-{path.parent.name}"})
+        for path in pdf_paths
+    }
+
+    processor = PDFProcessor()
+    processor._settings = Mock(CACHE_DIR=cache_dir)
+    parse = Mock(side_effect=lambda path: parsed[path])
+    monkeypatch.setattr(processor, "_parse_pdf", parse)
+
+    for pdf_path in pdf_paths + pdf_paths:
+        assert processor.process_pdf(str(pdf_path)) == parsed[pdf_path]
+    assert parse.call_count == 2
+    assert len(list(cache_dir.glob("*.json"))) == 2
+    assert not list(cache_dir.glob("*.tmp"))
+
+    monkeypatch.setattr(process_pdf, "_CACHE_VERSION", process_pdf._CACHE_VERSION + 1)
+    processor.process_pdf(str(pdf_paths[0]))
+    assert parse.call_count == 3
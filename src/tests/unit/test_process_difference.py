@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+from hsi_pdf_agent.core.process_difference import DifferenceProcessor
+
+
+@pytest.mark.parametrize(
+    ("specification", "category", "subcategory", "unit"),
+    [
+        ("Voltage (V dc) Max", "Voltage", "", "V dc"),
+        ("Contact Rating (W) (max)", "Contact Rating (W)", "", "max"),
+        ("Switch (SPST (NO))", "Switch (SPST", "", "NO)"),
+        ("Electrical - Voltage (V)", "Electrical", "Voltage", "V"),
+        ("Electrical - Form", "Electrical", "Form", None),
+    ],
+)
+def test_analyze_differences_splits_unit(
+    specification: str,
+    category: str,
+    subcategory: str,
+    unit: str
+) -> None:
+    """Test that the unit is taken from the last parenthesized group."""
+    df = pd.DataFrame({
+        "Category": ["Electrical"],
+        "Specification": [specification],
+        "HSR-520R": ["100"],
+        "HSR-502R": ["200"],
+    })
+
+    differences = DifferenceProcessor.analyze_differences(df)
+
+    assert len(differences.differences) == 1
+    diff = differences.differences[0]
+    assert diff.category == category
+    assert diff.subcategory == subcategory
+    assert diff.unit == unit
+    assert diff.values == {"HSR-520R": "100", "HSR-502R": "200"}
+
+
+def test_analyze_differences_skips_missing_values() -> None:
+    """Test that missing, blank and "nan" cells do not count as values."""
+    df = pd.DataFrame({
+        "Category": ["Electrical"] * 4,
+        "Specification": ["Power (W)", "Voltage (V)", "Current (A)", "Form"],
+        "HSR-520R": ["10", None, " ", "nan"],
+        "HSR-502R": ["20", "200", "0.5", "A"],
+    })
+
+    differences = DifferenceProcessor.analyze_differences(df)
+
+    assert [diff.category for diff in differences.differences] == ["Power"]
@@ -0,0 +1,131 @@
+"""Tests for vector store functionality."""
+import numpy as np
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Union
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+from hsi_pdf_agent.core.vector_store import VectorStore
+from hsi_pdf_agent.models import VectorEntry
+
+@pytest.mark.asyncio
+async def test_add_entry(vector_store: VectorStore) -> None:
+    """Test adding an entry to the vector store."""
+    entry = await vector_store.add_entry("Test content")
+
+    assert entry.content == "Test content"
+    assert isinstance(entry.id, UUID)
+    assert isinstance(entry.updated_at, datetime)
+    assert isinstance(entry.embedding, list)
+    assert len(entry.embedding) == 1536  # text-embedding-3-small dimension
+    assert entry.model_name == "text-embedding-3-small"
+    assert entry.similarity_score is None
+
+@pytest.mark.asyncio
+async def test_search_empty_store(vector_store: VectorStore) -> None:
+    """Test searching when store is empty."""
+    results = await vector_store.search("test query")
+    assert len(results) == 0
+
+@pytest.mark.asyncio
+async def test_search_with_entries(
+    vector_store: VectorStore,
+    sample_vector_entry: VectorEntry
+) -> None:
+    """Test searching with entries in store."""
+    vector_store.entries.append(sample_vector_entry)
+    results = await vector_store.search("test query", top_k=1)
+
+    assert len(results) == 1
+    similarity, entry = results[0]
+    assert isinstance(similarity, float)
+    assert entry.id == sample_vector_entry.id
+
+EMBEDDINGS: Dict[str, List[float]] = {
+    "contact rating": [1.0, 0.1, 0.0],
+    "coil voltage": [0.0, 1.0, 0.2],
+    "blank": [0.0, 0.0, 0.0],
+}
+
+def _embeddings_create(model: str, input: Union[str, List[str]]) -> SimpleNamespace:
+    """Fake embeddings endpoint, returning the batch out of order like the API may."""
+    texts = [input] if isinstance(input, str) else input
+    data = [
+        SimpleNamespace(index=i, embedding=EMBEDDINGS[text])
+        for i, text in enumerate(texts)
+    ]
+    return SimpleNamespace(data=data[::-1])
+
+@pytest.fixture
+def mock_vector_store() -> VectorStore:
+    """Fixture for a VectorStore with a mocked embedding client and fixed entries."""
+    client = Mock()
+    client.embeddings.create.side_effect = _embeddings_create
+    store = VectorStore(client)
+    store.entries = [
+        VectorEntry(id=uuid4(), content=content, embedding=embedding)
+        for content, embedding in [
+            ("Switching current 0.5 A", [0.9, 0.3, 0.1]),
+            ("Coil resistance 500 Ohm", [0.1, 0.9, 0.4]),
+            ("Sealed glass capsule", [0.5, 0.5, 0.5]),
+            ("Unembedded section", [0.0, 0.0, 0.0]),
+        ]
+    ]
+    return store
+
+@pytest.mark.asyncio
+async def test_search_batch_matches_search(mock_vector_store: VectorStore) -> None:
+    """Test that each query in a batch ranks entries like search() does."""
+    queries = ["contact rating", "coil voltage", "blank"]
+
+    batch_results = await mock_vector_store.search_batch(queries, top_k=3)
+
+    assert len(batch_results) == len(queries)
+    for query, matches in zip(queries, batch_results):
+        expected = await mock_vector_store.search(query, top_k=3)
+        assert [entry.id for _, entry in matches] == [entry.id for _, entry in expected]
+        assert [score for score, _ in matches] == pytest.approx(
+            [score for score, _ in expected]
+        )
+    assert mock_vector_store.client.embeddings.create.call_count == 1 + len(queries)
+
+@pytest.mark.asyncio
+async def test_search_batch_top_k_exceeds_entries(mock_vector_store: VectorStore) -> None:
+    """Test that top_k larger than the store returns every entry."""
+    results = await mock_vector_store.search_batch(["contact rating"], top_k=10)
+
+    assert len(results) == 1
+    assert len(results[0]) == len(mock_vector_store.entries)
+    assert results[0][0][1].content == "Switching current 0.5 A"
+
+@pytest.mark.asyncio
+async def test_search_zero_norm_embeddings(mock_vector_store: VectorStore) -> None:
+    """Test that zero-norm query or entry embeddings score 0 instead of NaN."""
+    results = await mock_vector_store.search("blank", top_k=10)
+    batch_results = await mock_vector_store.search_batch(["contact rating"], top_k=10)
+
+    assert [score for score, _ in results] == [0.0] * len(mock_vector_store.entries)
+    assert batch_results[0][-1][1].content == "Unembedded section"
+    assert batch_results[0][-1][0] == 0.0
+
+@pytest.mark.asyncio
+async def test_embedding_matrix_reused_until_entries_change(
+    mock_vector_store: VectorStore
+) -> None:
+    """Test that searches share one float32 matrix that tracks added entries."""
+    await mock_vector_store.search("contact rating")
+    matrix, _ = mock_vector_store._embedding_matrix()
+    await mock_vector_store.search_batch(["coil voltage"])
+
+    assert mock_vector_store._embedding_matrix()[0] is matrix
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (len(mock_vector_store.entries), 3)
+
+    mock_vector_store.entries.append(
+        VectorEntry(id=uuid4(), content="Contact rating 10 W", embedding=[1.0, 0.1, 0.0])
+    )
+    results = await mock_vector_store.search("contact rating", top_k=1)
+
+    assert results[0][1].content == "Contact rating 10 W"
+    assert mock_vector_store._embedding_matrix()[0].shape == (5, 3)